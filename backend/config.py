@@ -1,5 +1,6 @@
 """Backend configuration for FastAPI application."""
 
+from functools import cached_property, lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
@@ -18,11 +19,18 @@ class BackendSettings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     reload: bool = False
+    web_concurrency: Optional[int] = None  # worker processes; defaults to 1
     log_level: str = "INFO"  # DEBUG, INFO, WARNING, ERROR, CRITICAL
 
     # CORS Configuration
     cors_origins: list[str] = ["http://localhost:5173",
                                "http://localhost:3000", "http://localhost:5174","https://voice-agent-nine-beige.vercel.app"]
+    cors_max_age: int = 86400  # seconds browsers may cache a preflight response
+
+    @cached_property
+    def cors_origins_set(self) -> frozenset[str]:
+        """Allowed origins as a set, so per-request origin checks are O(1)."""
+        return frozenset(self.cors_origins)
 
     # WebSocket Configuration
     ws_max_connections: int = 100
@@ -32,3 +40,9 @@ class BackendSettings(BaseSettings):
     audio_sample_rate: int = 24000
     audio_channels: int = 1
     audio_chunk_size: int = 4096
+
+
+@lru_cache(maxsize=1)
+def get_backend_settings() -> BackendSettings:
+    """Return the process-wide BackendSettings, parsing the environment/.env only once."""
+    return BackendSettings()
@@ -1,32 +1,49 @@
 """FastAPI main application for Voice Agent web interface."""
 
 import logging
+import os
 import sys
-from pathlib import Path
 
 # Add backend/src so "voiceagent" resolves (voiceagent lives in backend/src/voiceagent/)
-_backend_dir = Path(__file__).resolve().parent
-sys.path.insert(0, str(_backend_dir / "src"))
-# Add repo root so "backend" package resolves
-sys.path.insert(0, str(_backend_dir.parent))
-
-from fastapi import FastAPI, WebSocket, Request
+# and the repo root so "backend" package resolves. Skip entries that PYTHONPATH
+# (e.g. the Docker image's /app) already provides.
+_backend_dir = os.path.dirname(os.path.abspath(__file__))
+for _path in (os.path.join(_backend_dir, "src"), os.path.dirname(_backend_dir)):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from fastapi import FastAPI, Response, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 import litellm
-from backend.config import BackendSettings
+import orjson
+from backend.config import get_backend_settings
 from backend.logging_config import setup_logging, get_logger
+from backend.middleware import ErrorASGIMiddleware
 from backend.routes import api
 from backend.routes.websocket import websocket_endpoint
 from backend.services.voice_service import VoiceService
 from backend.v1.bootstrap import init_db
 from backend.v1.routes import auth_router, billing_router, forms_router, public_router
+from voiceagent.models import aclose_http_client, get_http_client
 from rich.console import Console
 from contextlib import asynccontextmanager
 import uvicorn
 
+# uvloop/httptools come with uvicorn[standard] (uvloop is not available on Windows)
+try:
+    import uvloop  # noqa: F401
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+try:
+    import httptools  # noqa: F401
+    HAS_HTTPTOOLS = True
+except ImportError:
+    HAS_HTTPTOOLS = False
+
 # Initialize settings first so we can use log_level
-settings = BackendSettings()
+settings = get_backend_settings()
 
 # Set up logging so server errors are visible clearly (MemoryError, OSError, etc.)
 setup_logging(level=settings.log_level)
@@ -39,6 +56,10 @@ litellm._turn_on_debug()
 logging.getLogger("LiteLLM").setLevel(logging.DEBUG)
 logging.getLogger("litellm").setLevel(logging.DEBUG)
 
+# Set by __main__ once it has initialized the DB for a multi-worker run, so the
+# workers (which inherit the environment) skip migrations and seeding
+_DB_READY_ENV = "AGENTIC_FORMS_DB_READY"
+
 # Initialize voice service
 voice_service = None
 
@@ -53,12 +74,15 @@ async def lifespan(app: FastAPI):
 
     # Startup
     try:
-        init_db()
-        logger.info("Agentic Forms DB initialized")
+        if os.environ.get(_DB_READY_ENV) != "1":
+            init_db()
+            logger.info("Agentic Forms DB initialized")
 
         logger.info("Initializing Voice Service...")
         voice_service = VoiceService()
         app.state.voice_service = voice_service
+        # Pooled outbound client shared with the TTS model (closed on shutdown)
+        app.state.http_client = get_http_client()
         # Set global reference for routes
         api.voice_service = voice_service
         from backend.routes import websocket as ws_module
@@ -72,6 +96,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down Voice Agent API...")
+    await aclose_http_client()
 
 
 # Create FastAPI app with lifespan
@@ -83,31 +108,20 @@ app = FastAPI(
 )
 
 
-@app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception):
-    """Catch unhandled exceptions so the server stays alive and errors are logged."""
-    logger.exception(
-        "Unhandled exception: %s (path=%s)",
-        exc,
-        request.url.path,
-    )
-    return JSONResponse(
-        status_code=500,
-        content={
-            "detail": "Internal server error",
-            "error_type": type(exc).__name__,
-        },
-    )
-
-# Configure CORS
+# Configure CORS (CORSMiddleware is already pure ASGI)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins,
+    allow_origins=settings.cors_origins_set,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=settings.cors_max_age,
 )
 
+# Catch unhandled exceptions so the server stays alive and errors are logged
+# (outermost, so 500s are produced for anything CORS or the routes raise)
+app.add_middleware(ErrorASGIMiddleware)
+
 
 # Include routers
 app.include_router(api.router, prefix="/api", tags=["api"])
@@ -125,27 +139,49 @@ async def websocket_route(websocket: WebSocket):
     await websocket_endpoint(websocket)
 
 
+# Static service metadata, serialized once at import
+_ROOT_JSON = orjson.dumps({
+    "service": "Voice Agent API",
+    "version": "1.0.0",
+    "status": "running",
+    "websocket": "/ws",
+    "api": "/api",
+    "agentic_forms_api": "/v1",
+})
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
-    return JSONResponse(
-        {
-            "service": "Voice Agent API",
-            "version": "1.0.0",
-            "status": "running",
-            "websocket": "/ws",
-            "api": "/api",
-            "agentic_forms_api": "/v1",
-        }
-    )
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 
 if __name__ == "__main__":
-    logger.info("Starting Voice Agent API on %s:%s", settings.host, settings.port)
+    # Worker processes from WEB_CONCURRENCY (same variable the uvicorn CLI reads),
+    # else one. Uvicorn does not allow multiple workers with reload.
+    # /ws connections and their ConnectionManager entries live in one worker;
+    # v1 ephemeral state is shared across workers only when REDIS_URL is set.
+    workers = 1 if settings.reload else (settings.web_concurrency or 1)
+    if workers > 1:
+        # Migrate and seed once here; concurrent workers would race on the
+        # SQLite file and insert duplicate default rows
+        init_db()
+        os.environ[_DB_READY_ENV] = "1"
+        logger.info("Agentic Forms DB initialized")
+    logger.info(
+        "Starting Voice Agent API on %s:%s (%d worker(s))",
+        settings.host,
+        settings.port,
+        workers,
+    )
     uvicorn.run(
         "backend.main:app",
         host=settings.host,
         port=settings.port,
         reload=settings.reload,
+        workers=workers,
+        loop="uvloop" if HAS_UVLOOP else "asyncio",
+        http="httptools" if HAS_HTTPTOOLS else "h11",
+        ws="websockets",
         log_level="info",
     )
@@ -0,0 +1,57 @@
+"""Pure ASGI middleware for the backend app."""
+
+import orjson
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class ErrorASGIMiddleware:
+    """Turn unhandled exceptions in HTTP requests into a JSON 500 and log them.
+
+    Wraps the app directly instead of going through an exception handler, so no
+    Request/Response objects are built on the normal (non-failing) path.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            logger.exception(
+                "Unhandled exception: %s (path=%s)",
+                exc,
+                scope.get("path"),
+            )
+            if response_started:
+                # Too late to send a 500; let the server drop the connection
+                raise
+            body = orjson.dumps({
+                "detail": "Internal server error",
+                "error_type": type(exc).__name__,
+            })
+            await send({
+                "type": "http.response.start",
+                "status": 500,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
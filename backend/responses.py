@@ -0,0 +1,17 @@
+"""Response classes shared by the backend routes."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson.
+
+    Use for routes that return plain dicts. Routes with a ``response_model`` should
+    keep FastAPI's default JSONResponse, which already serializes through Pydantic.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
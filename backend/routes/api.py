@@ -1,21 +1,121 @@
 """REST API routes for configuration and health checks."""
 
+import asyncio
 import os
+import random
+import time
 from typing import Optional
 
 import httpx
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel
 
 from backend.logging_config import get_logger
+from backend.responses import ORJSONResponse
 from backend.services.voice_service import VoiceService
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = get_logger(__name__)
 
 # Global voice service instance (will be initialized in main.py)
 voice_service: Optional[VoiceService] = None
 
+# Static health payload, serialized once at import
+_HEALTH_JSON = orjson.dumps({
+    "status": "healthy",
+    "service": "voice-agent-api",
+})
+
+# Serialized settings for the current voice service; refreshed on PUT /settings
+_settings_cache: Optional[tuple[VoiceService, bytes]] = None
+
+
+def _settings_json() -> bytes:
+    """Return the current settings as JSON bytes, serializing only after a change."""
+    global _settings_cache
+    if _settings_cache is None or _settings_cache[0] is not voice_service:
+        _settings_cache = (voice_service, orjson.dumps(voice_service.get_settings()))
+    return _settings_cache[1]
+
+
+class CircuitBreaker:
+    """
+    Minimal circuit breaker: CLOSED until `failure_threshold` consecutive failures,
+    then OPEN (calls rejected) for `reset_seconds`, then HALF_OPEN where a single
+    probe call decides whether to close again or re-open; other callers are
+    rejected until it reports back (or until `reset_seconds` if it never does).
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_seconds: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = "CLOSED"
+        self.failure_count = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.probe_started_at = 0.0
+
+    def allow(self) -> bool:
+        """Return False while open, or while half-open with a probe already out."""
+        now = time.monotonic()
+        if self.state == "OPEN":
+            if now - self.opened_at < self.reset_seconds:
+                return False
+            self.state = "HALF_OPEN"
+            self.probe_in_flight = False
+        if self.state == "HALF_OPEN":
+            if self.probe_in_flight and now - self.probe_started_at < self.reset_seconds:
+                return False
+            self.probe_in_flight = True
+            self.probe_started_at = now
+        return True
+
+    def record_success(self) -> None:
+        self.state = "CLOSED"
+        self.failure_count = 0
+        self.probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failure_count += 1
+        self.probe_in_flight = False
+        if self.state == "HALF_OPEN" or self.failure_count >= self.failure_threshold:
+            self.state = "OPEN"
+            self.opened_at = time.monotonic()
+
+
+# Bound concurrent Groq pings from /spin and fail fast while Groq is known to be down
+SPIN_MAX_CONCURRENCY = 4
+_spin_bulkhead = asyncio.Semaphore(SPIN_MAX_CONCURRENCY)
+_spin_breaker = CircuitBreaker()
+SPIN_MAX_ATTEMPTS = 3
+
+
+async def _ping_groq(client: httpx.AsyncClient, api_key: str) -> httpx.Response:
+    """
+    GET the Groq models list, retrying timeouts, transport errors, 429 and 5xx with
+    full-jitter exponential backoff. Other 4xx responses are raised immediately.
+    """
+    for attempt in range(SPIN_MAX_ATTEMPTS):
+        try:
+            async with _spin_bulkhead:
+                response = await client.get(
+                    "https://api.groq.com/openai/v1/models",
+                    headers={"Authorization": f"Bearer {api_key}"},
+                    timeout=60.0,
+                )
+            response.raise_for_status()
+            return response
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            if (status < 500 and status != 429) or attempt == SPIN_MAX_ATTEMPTS - 1:
+                raise
+        except httpx.TransportError:
+            if attempt == SPIN_MAX_ATTEMPTS - 1:
+                raise
+        # Sleep outside the bulkhead so waiting retries don't hold a slot
+        await asyncio.sleep(random.uniform(0, min(8.0, 0.5 * 2 ** attempt)))
+
 
 class SettingsUpdate(BaseModel):
     """Settings update model."""
@@ -32,14 +132,11 @@ class SettingsUpdate(BaseModel):
 @router.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": "voice-agent-api",
-    }
+    return Response(content=_HEALTH_JSON, media_type="application/json")
 
 
 @router.get("/spin")
-async def spin_server():
+async def spin_server(request: Request):
     """
     Warm / verify Groq API connectivity (STT/LLM/TTS). Frontend can call this
     while showing 'Voice agent is getting ready'.
@@ -51,28 +148,37 @@ async def spin_server():
     api_key = os.getenv("GROQ_API_KEY", "") or voice_service.settings.groq_api_key
     if not api_key:
         raise HTTPException(status_code=503, detail="GROQ_API_KEY not configured")
+    if not _spin_breaker.allow():
+        raise HTTPException(
+            status_code=503,
+            detail="Groq API recently unreachable; retry shortly",
+        )
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(
-                "https://api.groq.com/openai/v1/models",
-                headers={"Authorization": f"Bearer {api_key}"},
-            )
-            response.raise_for_status()
-            data = response.json()
-            return {"status": "ok", "groq": "reachable", "models_count": len(data.get("data", []))}
+        response = await _ping_groq(request.app.state.http_client, api_key)
+        data = response.json()
+        _spin_breaker.record_success()
+        return {"status": "ok", "groq": "reachable", "models_count": len(data.get("data", []))}
     except httpx.TimeoutException:
+        _spin_breaker.record_failure()
         logger.warning("Groq API did not respond in time")
         raise HTTPException(
             status_code=504,
             detail="Groq API did not respond in time",
         )
     except httpx.HTTPStatusError as e:
+        # Only upstream (5xx) errors mean Groq is unhealthy; a 4xx (our request/key)
+        # still shows Groq answering, so it closes the breaker
+        if e.response.status_code >= 500:
+            _spin_breaker.record_failure()
+        else:
+            _spin_breaker.record_success()
         logger.warning("Groq API error: %s %s", e.response.status_code, e.response.text)
         raise HTTPException(
             status_code=e.response.status_code,
             detail=f"Groq API error: {e.response.text}",
         )
     except Exception as e:
+        _spin_breaker.record_failure()
         logger.exception("Failed to reach Groq API: %s", e)
         raise HTTPException(
             status_code=502,
@@ -86,18 +192,20 @@ async def get_settings():
     if not voice_service:
         raise HTTPException(
             status_code=503, detail="Voice service not initialized")
-    return voice_service.get_settings()
+    return Response(content=_settings_json(), media_type="application/json")
 
 
 @router.put("/settings")
 async def update_settings(settings_update: SettingsUpdate):
     """Update agent settings."""
+    global _settings_cache
     if not voice_service:
         raise HTTPException(
             status_code=503, detail="Voice service not initialized")
 
     update_dict = settings_update.model_dump(exclude_unset=True)
     voice_service.update_settings(**update_dict)
+    _settings_cache = None
 
     return {"status": "updated", "settings": voice_service.get_settings()}
 
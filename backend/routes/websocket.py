@@ -1,8 +1,18 @@
 """WebSocket routes for real-time voice communication."""
 
-import base64
+import asyncio
+import logging
 import time
-from typing import Optional
+from functools import partial
+from typing import AsyncIterator, Optional
+
+import orjson
+
+# SIMD base64 when installed (`pybase64`); drop-in for the stdlib module
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
 from fastapi import WebSocket, WebSocketDisconnect
 from backend.services.voice_service import VoiceService
 from backend.logging_config import get_logger
@@ -12,9 +22,31 @@ logger = get_logger(__name__)
 # Global voice service instance (will be initialized in main.py)
 voice_service: Optional[VoiceService] = None
 
+# Upper bound on bytes merged into one outgoing audio frame
+AUDIO_COALESCE_BYTES = 64 * 1024
+# Chunks buffered ahead of a slow client before the TTS producer waits
+AUDIO_QUEUE_MAXSIZE = 256
+
+
+# Constant control messages, serialized once at import
+_STATE_FRAMES = {
+    state: orjson.dumps({"type": "state", "data": state}).decode()
+    for state in ("connected", "listening", "processing", "idle")
+}
+_AUDIO_STREAM_BEGIN_FRAME = orjson.dumps({"type": "audio_stream_begin"}).decode()
+
+
+async def _send_json(websocket: WebSocket, message: dict) -> None:
+    """Send a JSON control message as a text frame (binary frames carry audio)."""
+    await websocket.send_text(orjson.dumps(message).decode())
+
 
 class ConnectionManager:
-    """Manages WebSocket connections."""
+    """Manages WebSocket connections.
+
+    Connections are tracked per worker process; with several uvicorn workers each
+    one only sees the sockets it accepted.
+    """
 
     def __init__(self):
         self.active_connections: dict[str, WebSocket] = {}
@@ -27,28 +59,101 @@ class ConnectionManager:
 
     def disconnect(self, client_id: str):
         """Remove WebSocket connection."""
-        if client_id in self.active_connections:
-            del self.active_connections[client_id]
+        if self.active_connections.pop(client_id, None) is not None:
             logger.info("Client disconnected: %s", client_id)
 
     async def send_message(self, client_id: str, message: dict):
         """Send message to specific client."""
-        if client_id in self.active_connections:
-            try:
-                await self.active_connections[client_id].send_json(message)
-            except Exception as e:
-                logger.exception("Error sending message to %s: %s", client_id, e)
-                self.disconnect(client_id)
+        websocket = self.active_connections.get(client_id)
+        if websocket is None:
+            return
+        try:
+            await _send_json(websocket, message)
+        except Exception as e:
+            logger.exception("Error sending message to %s: %s", client_id, e)
+            self.disconnect(client_id)
 
 
 manager = ConnectionManager()
 
 
+async def _send_audio_stream(websocket: WebSocket, audio_iter: AsyncIterator[bytes]) -> int:
+    """
+    Forward TTS audio through a bounded queue (AUDIO_QUEUE_MAXSIZE) drained by a
+    single sender task, so a slow client backs up the producer. The sender merges
+    chunks that are already waiting into one binary frame (up to AUDIO_COALESCE_BYTES).
+    Returns the number of chunks produced by the iterator.
+    """
+    queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue(maxsize=AUDIO_QUEUE_MAXSIZE)
+
+    async def sender() -> None:
+        while True:
+            chunk = await queue.get()
+            if chunk is None:
+                return
+            batch = [chunk]
+            size = len(chunk)
+            finished = False
+            while size < AUDIO_COALESCE_BYTES and not queue.empty():
+                chunk = queue.get_nowait()
+                if chunk is None:
+                    finished = True
+                    break
+                batch.append(chunk)
+                size += len(chunk)
+            await websocket.send_bytes(batch[0] if len(batch) == 1 else b"".join(batch))
+            if finished:
+                return
+
+    sender_task = asyncio.create_task(sender())
+
+    async def put(item: Optional[bytes]) -> bool:
+        """Queue item, waiting while the queue is full; False if the sender stopped."""
+        if sender_task.done():
+            return False
+        if not queue.full():
+            queue.put_nowait(item)
+            return True
+        put_task = asyncio.create_task(queue.put(item))
+        await asyncio.wait({put_task, sender_task}, return_when=asyncio.FIRST_COMPLETED)
+        if put_task.done():
+            return True
+        put_task.cancel()
+        return False
+
+    chunk_count = 0
+    try:
+        async for audio_chunk in audio_iter:
+            if not await put(audio_chunk):
+                break  # send failed; surfaced by the await below
+            chunk_count += 1
+        await put(None)
+        await sender_task
+    finally:
+        if not sender_task.done():
+            sender_task.cancel()
+    return chunk_count
+
+
+async def _receive_frame(websocket: WebSocket) -> tuple[Optional[dict], Optional[bytes]]:
+    """
+    Receive one frame: binary frames carry raw recorded audio, text frames carry
+    JSON control messages. Returns (message, None) or (None, audio_bytes).
+    """
+    frame = await websocket.receive()
+    if frame["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(frame.get("code", 1000))
+    audio = frame.get("bytes")
+    if audio is not None:
+        return None, audio
+    return orjson.loads(frame["text"]), None
+
+
 async def _send_error_and_idle(websocket: WebSocket, message: str) -> None:
     """Send error and idle state to client; ignore send failures (connection may be closed)."""
     try:
-        await websocket.send_json({"type": "error", "data": message})
-        await websocket.send_json({"type": "state", "data": "idle"})
+        await _send_json(websocket, {"type": "error", "data": message})
+        await websocket.send_text(_STATE_FRAMES["idle"])
     except Exception:
         pass
 
@@ -60,7 +165,14 @@ async def websocket_endpoint(websocket: WebSocket):
     the server stays alive and keeps accepting new connections.
     """
     client_id = None
-    audio_buffer = []
+    audio_buffer = bytearray()
+
+    # Bind per-message helpers once; the loop below runs for every frame
+    send_json = partial(_send_json, websocket)
+    send_text = websocket.send_text
+    receive_frame = partial(_receive_frame, websocket)
+    send_audio_stream = partial(_send_audio_stream, websocket)
+    b64decode = base64.b64decode
 
     try:
         # Accept WebSocket connection FIRST (required by FastAPI)
@@ -74,10 +186,10 @@ async def websocket_endpoint(websocket: WebSocket):
         logger.info("Client connected: %s", client_id)
 
         # Send connection confirmation
-        await websocket.send_json({"type": "state", "data": "connected"})
+        await send_text(_STATE_FRAMES["connected"])
 
         if not voice_service:
-            await websocket.send_json({
+            await send_json({
                 "type": "error",
                 "data": "Voice service not initialized",
             })
@@ -86,7 +198,11 @@ async def websocket_endpoint(websocket: WebSocket):
         # Main message loop: on any error we log, notify client if possible, then exit loop
         while True:
             try:
-                message = await websocket.receive_json()
+                message, audio_frame = await receive_frame()
+                if audio_frame is not None:
+                    # Raw audio bytes for the current recording
+                    audio_buffer.extend(audio_frame)
+                    continue
                 msg_type = message.get("type")
 
                 # Handle connect message (optional, sent by client)
@@ -95,23 +211,21 @@ async def websocket_endpoint(websocket: WebSocket):
                     provided_id = message.get("client_id")
                     if provided_id and provided_id != client_id:
                         # Update client_id mapping
-                        if client_id in manager.active_connections:
-                            del manager.active_connections[client_id]
+                        manager.active_connections.pop(client_id, None)
                         client_id = provided_id
                         manager.active_connections[client_id] = websocket
-                    await websocket.send_json({"type": "state", "data": "connected"})
+                    await send_text(_STATE_FRAMES["connected"])
                     continue
 
                 if msg_type == "start_recording":
-                    audio_buffer = []
-                    await websocket.send_json({"type": "state", "data": "listening"})
+                    audio_buffer = bytearray()
+                    await send_text(_STATE_FRAMES["listening"])
 
                 elif msg_type == "audio_chunk":
-                    # Receive audio chunk (base64 encoded)
+                    # Legacy JSON audio chunk (base64 encoded)
                     audio_data_b64 = message.get("data", "")
                     try:
-                        audio_chunk = base64.b64decode(audio_data_b64)
-                        audio_buffer.append(audio_chunk)
+                        audio_buffer.extend(b64decode(audio_data_b64))
                     except Exception as e:
                         logger.warning("Error decoding audio from %s: %s", client_id, e)
 
@@ -121,27 +235,26 @@ async def websocket_endpoint(websocket: WebSocket):
                     final_chunk = message.get("data", "")
                     if final_chunk:
                         try:
-                            audio_chunk = base64.b64decode(final_chunk)
-                            audio_buffer.append(audio_chunk)
+                            audio_buffer.extend(b64decode(final_chunk))
                         except Exception:
                             pass
 
                     if not audio_buffer:
-                        await websocket.send_json({
+                        await send_json({
                             "type": "error",
                             "data": "No audio data received",
                         })
                         continue
 
-                    await websocket.send_json({"type": "state", "data": "processing"})
+                    await send_text(_STATE_FRAMES["processing"])
 
-                    # Combine audio chunks
-                    complete_audio = b"".join(audio_buffer)
-                    audio_buffer = []
+                    # Hand off the accumulated audio and start a fresh buffer (no copy)
+                    complete_audio = audio_buffer
+                    audio_buffer = bytearray()
 
                     try:
                         # Record start time for processing
-                        processing_start_time = time.time()
+                        processing_start_time = time.perf_counter()
 
                         # Process audio through voice agent
                         transcribed_text, audio_response_iter = (
@@ -149,94 +262,81 @@ async def websocket_endpoint(websocket: WebSocket):
                         )
 
                         # Send transcription
-                        await websocket.send_json({
+                        await send_json({
                             "type": "transcription",
                             "data": transcribed_text,
                         })
 
                         # Calculate processing time (from start to speaking)
-                        processing_time = time.time() - processing_start_time
+                        processing_time = time.perf_counter() - processing_start_time
 
                         # Stream audio response with processing time
-                        await websocket.send_json({
+                        await send_json({
                             "type": "state",
                             "data": "speaking",
-                            "processing_time": round(processing_time, 3)
+                            "processing_time": processing_time,
                         })
 
-                        async for audio_chunk in audio_response_iter:
-                            audio_b64 = base64.b64encode(
-                                audio_chunk).decode("utf-8")
-                            await websocket.send_json({
-                                "type": "audio_chunk",
-                                "data": audio_b64,
-                            })
+                        # Following binary frames are raw PCM until the idle state
+                        await send_text(_AUDIO_STREAM_BEGIN_FRAME)
+                        await send_audio_stream(audio_response_iter)
 
                         # Send completion
-                        await websocket.send_json({"type": "state", "data": "idle"})
+                        await send_text(_STATE_FRAMES["idle"])
 
                     except Exception as e:
                         logger.exception("Error processing audio for %s: %s", client_id, e)
-                        await _send_error_and_idle(websocket, f"Processing error: {str(e)}")
+                        await _send_error_and_idle(websocket, f"Processing error: {e}")
 
                 elif msg_type == "text_message":
                     # Process text message
                     text = message.get("data", "")
                     if not text:
-                        await manager.send_message(
-                            client_id,
-                            {
-                                "type": "error",
-                                "data": "Empty text message",
-                            },
-                        )
+                        await send_json({
+                            "type": "error",
+                            "data": "Empty text message",
+                        })
                         continue
 
-                    await websocket.send_json({"type": "state", "data": "processing"})
+                    await send_text(_STATE_FRAMES["processing"])
 
                     try:
                         # Record start time for processing
-                        processing_start_time = time.time()
+                        processing_start_time = time.perf_counter()
 
                         response_text, audio_response_iter = (
                             await voice_service.process_text_message(text)
                         )
 
                         # Send text response
-                        await websocket.send_json({
+                        await send_json({
                             "type": "transcription",
                             "data": response_text,
                         })
 
                         # Calculate processing time (from start to speaking)
-                        processing_time = time.time() - processing_start_time
+                        processing_time = time.perf_counter() - processing_start_time
 
                         # Stream audio response with processing time
-                        await websocket.send_json({
+                        await send_json({
                             "type": "state",
                             "data": "speaking",
-                            "processing_time": round(processing_time, 3)
+                            "processing_time": processing_time,
                         })
 
-                        audio_chunk_count = 0
-                        async for audio_chunk in audio_response_iter:
-                            audio_chunk_count += 1
-                            audio_b64 = base64.b64encode(
-                                audio_chunk).decode("utf-8")
-                            await websocket.send_json({
-                                "type": "audio_chunk",
-                                "data": audio_b64,
-                            })
+                        await send_text(_AUDIO_STREAM_BEGIN_FRAME)
+                        audio_chunk_count = await send_audio_stream(audio_response_iter)
 
-                        logger.debug("Sent %s audio chunks to %s", audio_chunk_count, client_id)
-                        await websocket.send_json({"type": "state", "data": "idle"})
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Sent %s audio chunks to %s", audio_chunk_count, client_id)
+                        await send_text(_STATE_FRAMES["idle"])
 
                     except Exception as e:
                         logger.exception("Error processing text for %s: %s", client_id, e)
-                        await _send_error_and_idle(websocket, f"Processing error: {str(e)}")
+                        await _send_error_and_idle(websocket, f"Processing error: {e}")
 
                 else:
-                    await websocket.send_json({
+                    await send_json({
                         "type": "error",
                         "data": f"Unknown message type: {msg_type}",
                     })
@@ -252,7 +352,7 @@ async def websocket_endpoint(websocket: WebSocket):
                     client_id,
                     e,
                 )
-                await _send_error_and_idle(websocket, f"Server error: {str(e)}")
+                await _send_error_and_idle(websocket, f"Server error: {e}")
                 break
 
     except WebSocketDisconnect:
@@ -261,7 +361,7 @@ async def websocket_endpoint(websocket: WebSocket):
         # Catch-all so no exception kills the server (e.g. MemoryError, OSError)
         logger.exception("WebSocket endpoint error for %s: %s", client_id, e)
         try:
-            await _send_error_and_idle(websocket, f"Connection error: {str(e)}")
+            await _send_error_and_idle(websocket, f"Connection error: {e}")
         except Exception:
             pass
     finally:
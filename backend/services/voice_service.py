@@ -1,22 +1,44 @@
 """Voice service wrapper for WebSocket integration."""
 
+import asyncio
 import io
-import os
+import re
+import shutil
 import subprocess
-import tempfile
-import wave
 from typing import Any, AsyncIterator, Optional
 
 import numpy as np
-from agents.voice import VoicePipeline, VoicePipelineConfig
-from voiceagent import VoiceAgent, Settings
+
+# In-process WebM/Opus decoding via libav (`av` extra); otherwise shell out to ffmpeg
+try:
+    import av
+    HAS_AV = True
+except ImportError:
+    HAS_AV = False
+
+from agents.voice import TTSModelSettings, VoicePipeline, VoicePipelineConfig
+from voiceagent import VoiceAgent, Settings, get_settings
 from voiceagent.models import GroqVoiceModelProvider
-from voiceagent.models.groq_tts import all_supported_voices_for_model
+from voiceagent.models.groq_tts import (
+    TTS_CHUNK_BYTES,
+    all_supported_voices_for_model,
+    parse_wav,
+    resample_int16,
+)
 
 from backend.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Start of a WAV file: "RIFF" <4-byte size> "WAVE"
+_RIFF_WAVE_RE = re.compile(rb"RIFF.{4}WAVE", re.DOTALL)
+
+# Looked up once; avoids spawning `ffmpeg -version` on every utterance
+_FFMPEG_AVAILABLE = shutil.which("ffmpeg") is not None
+
+# GroqTTSModel does not read or mutate the settings, so one instance serves every request
+_DEFAULT_TTS_SETTINGS = TTSModelSettings()
+
 
 class VoiceService:
     """Service layer for voice agent operations via WebSocket."""
@@ -28,7 +50,8 @@ class VoiceService:
         Args:
             settings: VoiceAgent settings
         """
-        self.settings = settings or Settings()
+        # Own copy: update_settings mutates it, the cached process-wide one must not change
+        self.settings = settings or get_settings().model_copy()
         self.agent: Optional[VoiceAgent] = None
         self._voice_provider: Optional[GroqVoiceModelProvider] = None
         self._initialize_voice_provider()
@@ -69,34 +92,44 @@ class VoiceService:
         config = VoicePipelineConfig(model_provider=self._voice_provider)
         return VoicePipeline(workflow=workflow, config=config)
 
-    def audio_bytes_to_int16_24k(self, audio_data: bytes) -> np.ndarray:
+    def audio_bytes_to_int16_24k(self, audio_data: bytes | bytearray) -> np.ndarray:
         """Decode WebM/WAV/PCM bytes to mono int16 at 24 kHz (for VoicePipeline AudioInput)."""
-        def _safe_int16_buffer(raw: bytes) -> np.ndarray:
+        def _safe_int16_buffer(raw: bytes | memoryview) -> np.ndarray:
             n = (len(raw) // 2) * 2
             if n < len(raw):
                 logger.debug(
                     "Truncated audio buffer by %d byte(s) for int16 alignment",
                     len(raw) - n,
                 )
-            return np.frombuffer(raw[:n], dtype=np.int16)
+            # count= instead of raw[:n]: slicing bytes/bytearray would copy the whole buffer
+            return np.frombuffer(raw, dtype=np.int16, count=n // 2)
+
+        def _wav_int16(wav_data: bytes | bytearray) -> tuple[np.ndarray, int]:
+            # View the data chunk in place instead of wave.readframes() copying it
+            parsed = parse_wav(wav_data)
+            if parsed is None:
+                raise ValueError("Not a PCM WAV file")
+            pcm_view, wav_rate, channels = parsed[0], parsed[1], parsed[2]
+            samples = _safe_int16_buffer(pcm_view)
+            if channels > 1:
+                # Vectorized mean across interleaved channels (int32 sum cannot overflow)
+                frames = samples[: len(samples) - len(samples) % channels].reshape(-1, channels)
+                samples = (frames.sum(axis=1, dtype=np.int32) // channels).astype(np.int16)
+            return samples, wav_rate
 
         sample_rate = 24000
         audio_array = None
         try:
-            audio_io = io.BytesIO(audio_data)
-            with wave.open(audio_io, "rb") as wav_file:
-                sample_rate = wav_file.getframerate()
-                audio_bytes = wav_file.readframes(wav_file.getnframes())
-                audio_array = _safe_int16_buffer(audio_bytes)
+            audio_array, sample_rate = _wav_int16(audio_data)
         except Exception as e1:
             logger.debug("Not WAV format, trying WebM conversion: %s", e1)
             try:
-                wav_data = self._convert_webm_to_wav(audio_data)
-                audio_io = io.BytesIO(wav_data)
-                with wave.open(audio_io, "rb") as wav_file:
-                    sample_rate = wav_file.getframerate()
-                    audio_bytes = wav_file.readframes(wav_file.getnframes())
-                    audio_array = _safe_int16_buffer(audio_bytes)
+                if HAS_AV:
+                    audio_array = self._decode_webm_pcm(audio_data)
+                    sample_rate = 24000
+                else:
+                    audio_array = _safe_int16_buffer(self._convert_webm_to_pcm(audio_data))
+                    sample_rate = 24000
             except Exception as e2:
                 logger.warning("Could not process audio format: %s. Trying raw PCM.", e2)
                 audio_array = _safe_int16_buffer(audio_data)
@@ -105,74 +138,70 @@ class VoiceService:
         if audio_array is None or len(audio_array) == 0:
             raise ValueError("No valid audio data: buffer empty or failed to decode")
 
-        if len(audio_array.shape) > 1:
-            audio_array = audio_array[:, 0]
-        audio_array = audio_array.flatten()
+        # ravel() is a no-op view for the 1-D arrays produced above (flatten() always copied)
+        audio_array = audio_array.ravel()
 
-        if sample_rate != 24000:
-            from scipy import signal
+        return resample_int16(audio_array, sample_rate, 24000)
 
-            num_samples = int(len(audio_array) * 24000 / sample_rate)
-            audio_array = signal.resample(audio_array, num_samples).astype(np.int16)
+    def _decode_webm_pcm(self, webm_data: bytes) -> np.ndarray:
+        """
+        Decode WebM (or any libav-supported) audio in-process with PyAV.
 
-        return audio_array
+        Args:
+            webm_data: Encoded audio data as bytes
 
-    def _convert_webm_to_wav(self, webm_data: bytes) -> bytes:
+        Returns:
+            Mono int16 samples at 24 kHz
         """
-        Convert WebM audio to WAV format using ffmpeg (if available).
+        resampler = av.AudioResampler(format="s16", layout="mono", rate=24000)
+        chunks = []
+        with av.open(io.BytesIO(webm_data)) as container:
+            for frame in container.decode(audio=0):
+                for out in resampler.resample(frame):
+                    chunks.append(out.to_ndarray().reshape(-1))
+        # Flush samples still buffered in the resampler
+        for out in resampler.resample(None):
+            chunks.append(out.to_ndarray().reshape(-1))
+        if not chunks:
+            raise ValueError("No audio frames decoded")
+        return np.concatenate(chunks)
+
+    def _convert_webm_to_pcm(self, webm_data: bytes) -> bytes:
+        """
+        Convert WebM audio to raw PCM using ffmpeg (if available).
 
         Args:
             webm_data: WebM audio data as bytes
 
         Returns:
-            WAV audio data as bytes
+            Mono int16 little-endian PCM at 24 kHz (no WAV header)
         """
-        try:
-            # Check if ffmpeg is available
-            subprocess.run(['ffmpeg', '-version'],
-                           capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if not _FFMPEG_AVAILABLE:
             logger.warning("ffmpeg not found. WebM conversion may fail.")
             raise RuntimeError("ffmpeg not available for WebM conversion")
 
         try:
-            # Create temporary files
-            with tempfile.NamedTemporaryFile(suffix='.webm', delete=False) as webm_file:
-                webm_file.write(webm_data)
-                webm_path = webm_file.name
-
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as wav_file:
-                wav_path = wav_file.name
-
-            # Convert using ffmpeg
-            subprocess.run(
+            # Pipe through stdin/stdout; raw s16le output needs no WAV header to parse
+            result = subprocess.run(
                 [
-                    'ffmpeg', '-i', webm_path,
+                    'ffmpeg', '-hide_banner', '-loglevel', 'error',
+                    '-i', 'pipe:0',
                     '-ar', '24000',  # Sample rate
                     '-ac', '1',      # Mono
-                    '-f', 'wav',
-                    '-y',            # Overwrite output
-                    wav_path
+                    '-f', 's16le',
+                    'pipe:1'
                 ],
+                input=webm_data,
                 check=True,
                 capture_output=True
             )
-
-            # Read WAV file
-            with open(wav_path, 'rb') as f:
-                wav_data = f.read()
-
-            # Cleanup
-            os.unlink(webm_path)
-            os.unlink(wav_path)
-
-            return wav_data
+            return result.stdout
         except Exception as e:
-            logger.warning("Could not convert WebM to WAV: %s", e)
+            logger.warning("Could not convert WebM to PCM: %s", e)
             raise
 
     async def process_audio_chunk(
-        self, audio_data: bytes, sample_rate: int = 24000
+        self, audio_data: bytes | bytearray, sample_rate: int = 24000
     ) -> tuple[str, AsyncIterator[bytes]]:
         """
         Process audio chunk through the voice agent.
@@ -187,7 +216,8 @@ class VoiceService:
         if not self.agent:
             raise RuntimeError("VoiceAgent not initialized")
 
-        audio_array = self.audio_bytes_to_int16_24k(audio_data)
+        # WAV parsing / ffmpeg WebM conversion / resampling block; keep them off the loop
+        audio_array = await asyncio.to_thread(self.audio_bytes_to_int16_24k, audio_data)
 
         # Process through voice agent
         transcribed_text, audio_response = await self.agent.process_voice_input(
@@ -201,9 +231,13 @@ class VoiceService:
                 pcm_data = None
 
                 if isinstance(audio_response, np.ndarray):
-                    # Convert numpy array directly to PCM bytes
-                    pcm_data = audio_response.tobytes()
+                    # Byte view of the array; tobytes() would copy the whole response
+                    pcm_data = memoryview(np.ascontiguousarray(audio_response)).cast("B")
                     logger.debug("Converted numpy array to PCM: %s bytes", len(pcm_data))
+                elif isinstance(audio_response, (bytearray, memoryview)):
+                    # Raw 24 kHz int16 PCM collected by the pipeline
+                    pcm_data = memoryview(audio_response).cast("B")
+                    logger.debug("Using pipeline PCM: %s bytes", len(pcm_data))
                 elif isinstance(audio_response, bytes):
                     # If it's WAV bytes, extract PCM from WAV
                     pcm_data = self._extract_pcm_from_wav(audio_response)
@@ -221,14 +255,15 @@ class VoiceService:
 
                 logger.debug("PCM data ready: %s bytes", len(pcm_data))
 
-                # Stream PCM in smaller chunks for real-time playback
-                chunk_size = 4096  # Stream in 4KB chunks
+                # Stream PCM in smaller chunks for real-time playback;
+                # memoryview slices share pcm_data instead of copying each chunk
+                chunk_size = TTS_CHUNK_BYTES
                 chunk_count = 0
+                pcm_view = memoryview(pcm_data)
 
-                for i in range(0, len(pcm_data), chunk_size):
-                    pcm_chunk = pcm_data[i: i + chunk_size]
+                for i in range(0, len(pcm_view), chunk_size):
                     chunk_count += 1
-                    yield pcm_chunk
+                    yield pcm_view[i: i + chunk_size]
 
                 logger.debug("Streamed %s PCM chunks", chunk_count)
 
@@ -243,11 +278,9 @@ class VoiceService:
         TTS-only: synthesize the given text to raw int16 PCM at 24kHz.
         GroqTTSModel yields raw PCM after Groq WAV decode/resample.
         """
-        from agents.voice import TTSModelSettings
-
         logger.debug("Synthesizing speech for: %s", text[:80] + "..." if len(text) > 80 else text)
         tts = self._voice_provider.get_tts_model(None)
-        async for pcm_chunk in tts.run(text, TTSModelSettings()):
+        async for pcm_chunk in tts.run(text, _DEFAULT_TTS_SETTINGS):
             if pcm_chunk:
                 yield pcm_chunk
 
@@ -270,16 +303,13 @@ class VoiceService:
         # Generate audio response
         logger.debug("Generating audio for: %s", response_text[:80] + "..." if len(response_text) > 80 else response_text)
 
-        # Synthesize speech using the TTS model from voice pipeline
-        from agents.voice import TTSModelSettings
-
         # Stream PCM audio chunks as they're generated
         async def pcm_audio_iterator():
             try:
                 logger.debug("Streaming TTS PCM chunks...")
                 chunk_count = 0
                 async for pcm_chunk in self._voice_provider.get_tts_model(None).run(
-                    response_text, TTSModelSettings()
+                    response_text, _DEFAULT_TTS_SETTINGS
                 ):
                     if pcm_chunk:
                         chunk_count += 1
@@ -291,7 +321,8 @@ class VoiceService:
 
         return response_text, pcm_audio_iterator()
 
-    def _extract_pcm_from_wav(self, wav_data: bytes) -> Optional[bytes]:
+    @staticmethod
+    def _extract_pcm_from_wav(wav_data: bytes) -> Optional[bytes | memoryview]:
         """
         Extract raw PCM data from WAV file(s).
         Handles single WAV file or multiple concatenated WAV files.
@@ -300,104 +331,43 @@ class VoiceService:
             wav_data: WAV file bytes (may contain multiple WAV files concatenated)
 
         Returns:
-            Raw PCM data (Int16) or None if extraction fails
+            Raw PCM data (Int16) or None if extraction fails; a single WAV comes
+            back as a memoryview into wav_data (no copy)
         """
         try:
-            all_pcm_chunks = []
+            pcm_parts = []
             position = 0
-            wav_count = 0
-
-            # Handle multiple WAV files that may be concatenated
-            # Each WAV file starts with "RIFF" header at position 0
-            while position < len(wav_data):
-                # Check if we have a valid WAV header at current position
-                if position + 12 > len(wav_data):
-                    break
-
-                # Check for "RIFF" header
-                if wav_data[position:position + 4] != b'RIFF':
-                    # Try to find next "RIFF" header
-                    next_riff = wav_data.find(b'RIFF', position + 1)
-                    if next_riff == -1:
-                        # No more WAV files found
-                        break
-                    position = next_riff
-
-                # Read file size from WAV header (offset 4, size 4 bytes, little-endian)
-                file_size = int.from_bytes(
-                    wav_data[position + 4:position + 8], byteorder='little')
-                wav_file_end = position + 8 + file_size
-
-                # Make sure we have enough data
-                if wav_file_end > len(wav_data):
-                    # Try to read as much as we have
-                    wav_file_end = len(wav_data)
-
-                # Extract this WAV file
-                wav_file_data = wav_data[position:wav_file_end]
-
-                try:
-                    wav_io = io.BytesIO(wav_file_data)
-                    with wave.open(wav_io, 'rb') as wav_file:
-                        if wav_count == 0:
-                            logger.debug(
-                                "WAV info: %s ch, %s Hz, %s bytes/sample, %s frames",
-                                wav_file.getnchannels(),
-                                wav_file.getframerate(),
-                                wav_file.getsampwidth(),
-                                wav_file.getnframes(),
-                            )
-                        # Read the PCM data (skip the WAV header)
-                        pcm_chunk = wav_file.readframes(wav_file.getnframes())
-                        if pcm_chunk:
-                            all_pcm_chunks.append(pcm_chunk)
-                            wav_count += 1
-                            logger.debug("Extracted PCM from WAV %s: %s bytes", wav_count, len(pcm_chunk))
-                except Exception as e:
-                    logger.warning(
-                        "Could not extract WAV %s at position %s: %s",
-                        wav_count + 1,
-                        position,
-                        e,
-                    )
-                    # Move position forward to try next potential WAV file
-                    # Try to find next RIFF header
-                    next_riff = wav_data.find(b'RIFF', position + 1)
-                    if next_riff == -1:
-                        break
-                    position = next_riff
-                    continue
 
-                # Move to next potential WAV file
-                position = wav_file_end
-
-            if wav_count == 0:
-                # Fallback: try reading as single WAV file
-                try:
-                    wav_io = io.BytesIO(wav_data)
-                    with wave.open(wav_io, 'rb') as wav_file:
-                        logger.debug(
-                            "WAV info: %s ch, %s Hz, %s bytes/sample, %s frames",
-                            wav_file.getnchannels(),
-                            wav_file.getframerate(),
-                            wav_file.getsampwidth(),
-                            wav_file.getnframes(),
-                        )
-                        pcm_data = wav_file.readframes(wav_file.getnframes())
-                        if pcm_data:
-                            logger.debug("Extracted PCM from single WAV: %s bytes", len(pcm_data))
-                            return pcm_data
-                except Exception as e:
-                    logger.warning("Could not read as single WAV: %s", e)
+            # One scan for all RIFF/WAVE headers, then walk each file's chunks directly
+            for match in _RIFF_WAVE_RE.finditer(wav_data):
+                start = match.start()
+                if start < position:
+                    continue  # "RIFF....WAVE" bytes inside the previous file's samples
+                parsed = parse_wav(wav_data, start)
+                if parsed is None:
+                    logger.warning("No PCM data chunk in WAV at position %s", start)
+                    position = start + 12
+                    continue
+                pcm_view, sample_rate, channels, block_align, position = parsed
+                if not pcm_parts:
+                    logger.debug(
+                        "WAV info: %s ch, %s Hz, %s bytes/frame",
+                        channels,
+                        sample_rate,
+                        block_align,
+                    )
+                if pcm_view:
+                    pcm_parts.append(pcm_view)
 
+            if not pcm_parts:
                 logger.error("Could not extract PCM from any WAV file")
                 return None
 
-            # Combine all PCM chunks
-            combined_pcm = b"".join(all_pcm_chunks)
+            # Only several WAVs need joining; a single one is returned as its view
+            combined_pcm = pcm_parts[0] if len(pcm_parts) == 1 else b"".join(pcm_parts)
             logger.debug(
                 "Extracted PCM from %s WAV file(s): %s total bytes",
-                wav_count,
+                len(pcm_parts),
                 len(combined_pcm),
             )
             return combined_pcm
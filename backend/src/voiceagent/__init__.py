@@ -5,7 +5,7 @@ VoiceAgent - Production-grade voice agent using OpenAI Agents SDK and Groq model
 __version__ = "0.1.0"
 
 from .core.voice_agent import VoiceAgent
-from .config.settings import Settings
+from .config.settings import Settings, get_settings
 
-__all__ = ["VoiceAgent", "Settings"]
+__all__ = ["VoiceAgent", "Settings", "get_settings"]
 
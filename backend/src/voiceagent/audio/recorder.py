@@ -1,5 +1,6 @@
 """Audio recording with voice activity detection."""
 
+import math
 import time
 from typing import Optional
 import sounddevice as sd
@@ -35,10 +36,17 @@ class AudioRecorder:
         self.chunk_size = chunk_size
         self.silence_threshold = silence_threshold
         self.silence_duration = silence_duration
+        # Silence test compares mean energy against threshold**2 (no sqrt per block)
+        self._silence_energy = float(silence_threshold) ** 2
+
+    def _sum_squares(self, audio_chunk: np.ndarray) -> float:
+        """Sum of squared samples as one float64 dot product (int16 ** 2 would overflow)."""
+        samples = audio_chunk.ravel().astype(np.float64)
+        return float(samples.dot(samples))
 
     def _calculate_rms(self, audio_chunk: np.ndarray) -> float:
         """Calculate RMS (Root Mean Square) of audio chunk."""
-        return np.sqrt(np.mean(audio_chunk**2))
+        return math.sqrt(self._sum_squares(audio_chunk) / audio_chunk.size)
 
     def record(self, max_duration: Optional[float] = None) -> bytes:
         """
@@ -72,14 +80,14 @@ class AudioRecorder:
                             "[yellow]⏱️  Maximum duration reached[/yellow]")
                         break
 
-                    # Read audio chunk
+                    # Read audio chunk (read() returns a fresh array, no copy needed)
                     data, _ = stream.read(self.chunk_size)
-                    frames.append(data.copy())
+                    frames.append(data)
 
                     # Calculate volume and check for silence
-                    rms = self._calculate_rms(data)
+                    energy = self._sum_squares(data)
 
-                    if rms < self.silence_threshold:
+                    if energy < self._silence_energy * data.size:
                         silent_chunks += 1
                         if silent_chunks >= chunks_for_silence:
                             console.print(
@@ -91,26 +99,23 @@ class AudioRecorder:
         except KeyboardInterrupt:
             console.print("[yellow]⏹️  Recording interrupted[/yellow]")
 
-        # Concatenate all frames
-        audio_array = np.concatenate(frames, axis=0)
-        audio_data = audio_array.tobytes()
+        # Join the frames' buffers directly (one copy, no concatenate + tobytes)
+        audio_data = b"".join(frames)
 
         duration = len(audio_data) / (self.sample_rate * self.channels * 2)
         console.print(f"[green]✓ Recording complete ({duration:.1f}s)[/green]")
 
         return audio_data
 
-    def save_to_file(self, audio_data: bytes, filename: str) -> None:
+    def save_to_file(self, audio_data: bytes | bytearray | memoryview, filename: str) -> None:
         """Save audio data to WAV file."""
         import soundfile as sf
 
-        # Convert bytes to numpy array
+        # View bytes as int16 without copying
         audio_array = np.frombuffer(audio_data, dtype=np.int16)
         # Reshape if stereo
         if self.channels > 1:
             audio_array = audio_array.reshape(-1, self.channels)
 
-        # Convert to float for soundfile
-        audio_float = audio_array.astype(np.float32) / 32768.0
-
-        sf.write(filename, audio_float, self.sample_rate)
+        # int16 goes straight to a 16-bit PCM file; no float conversion pass
+        sf.write(filename, audio_array, self.sample_rate, subtype="PCM_16")
@@ -1,6 +1,6 @@
 """Configuration module for VoiceAgent."""
 
-from .settings import Settings
+from .settings import Settings, get_settings
 
-__all__ = ["Settings"]
+__all__ = ["Settings", "get_settings"]
 
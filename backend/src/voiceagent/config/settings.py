@@ -1,5 +1,7 @@
 """Configuration settings for VoiceAgent."""
 
+from functools import lru_cache
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -84,3 +86,9 @@ class Settings(BaseSettings):
             f"tts_voice={self.tts_voice}, "
             f"llm_model={self.llm_model})"
         )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings, parsing the environment/.env only once."""
+    return Settings()
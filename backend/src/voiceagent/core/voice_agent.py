@@ -9,18 +9,26 @@ Uses the SDK's VoicePipeline with Groq-backed models:
 
 from ..models.groq_llm import create_groq_model
 from ..models import GroqVoiceModelProvider
-from ..config.settings import Settings
+from ..config.settings import Settings, get_settings
 from agents.extensions.handoff_prompt import prompt_with_handoff_instructions
 from agents.voice import (
     VoicePipeline,
     SingleAgentVoiceWorkflow,
     AudioInput,
+    TTSModelSettings,
     VoicePipelineConfig,
 )
 from agents import Agent, set_tracing_disabled, Runner
+from openai.types.responses import ResponseTextDeltaEvent
+import asyncio
+import hashlib
+import io
+import logging
 import warnings
+from collections import OrderedDict
+from contextlib import aclosing
+from typing import AsyncIterator, MutableMapping, Optional
 import numpy as np
-from typing import Optional
 from rich.console import Console
 
 try:
@@ -34,6 +42,35 @@ warnings.filterwarnings("ignore", category=UserWarning, module="pydantic")
 
 
 console = Console()
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_MAX_SIZE = 1024
+
+
+class LRUResponseCache(OrderedDict):
+    """Bounded mapping that evicts the least recently used reply."""
+
+    def __init__(self, max_size: int = RESPONSE_CACHE_MAX_SIZE):
+        super().__init__()
+        self.max_size = max_size
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return self[key]
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.max_size:
+            self.popitem(last=False)
+
+
+# Replies for temperature=0 requests, shared across VoiceAgent instances since the
+# backend rebuilds the agent on every settings update. Keyed by
+# (llm_model, instructions digest, max_tokens, user_message).
+_response_cache = LRUResponseCache()
 
 
 class VoiceAgent:
@@ -44,14 +81,24 @@ class VoiceAgent:
     Audio Input → Groq STT → Agent (Groq LLM) → Groq PlayAI TTS → Audio Output
     """
 
-    def __init__(self, settings: Optional[Settings] = None):
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        response_cache: Optional[MutableMapping[tuple, str]] = None,
+    ):
         """
         Initialize VoiceAgent with OpenAI Agents SDK.
 
         Args:
             settings: Configuration settings
+            response_cache: Mapping used to memoize deterministic (temperature=0)
+                text replies; defaults to a process-wide LRU
         """
-        self.settings = settings or Settings()
+        self.settings = settings or get_settings()
+        self.response_cache = _response_cache if response_cache is None else response_cache
+        self._instructions_digest = hashlib.blake2b(
+            self.settings.agent_instructions.encode("utf-8"), digest_size=16
+        ).hexdigest()
 
         # Disable tracing if no OpenAI key (since we're using Groq)
         set_tracing_disabled(True)
@@ -109,18 +156,27 @@ class VoiceAgent:
 
     async def process_voice_input(
         self, audio_buffer: np.ndarray, play_response: bool = True
-    ) -> tuple[str, bytes]:
+    ) -> tuple[str, memoryview]:
         """
         Process voice input through the pipeline.
 
         Args:
-            audio_buffer: Audio data as numpy array
+            audio_buffer: Mono 24 kHz audio. int16 PCM is passed through as-is;
+                float arrays in [-1.0, 1.0] are converted to int16 once here.
             play_response: Whether to play the audio response
 
         Returns:
-            Tuple of (transcribed_text, audio_response_bytes)
+            Tuple of (transcribed_text, audio_response) where audio_response is
+            a byte view of the 24 kHz int16 PCM reply
         """
-        console.print("[bold green]🎤 Processing voice input...[/bold green]")
+        logger.debug("Processing voice input: %s samples", len(audio_buffer))
+
+        if np.issubdtype(audio_buffer.dtype, np.floating):
+            audio_buffer = np.clip(audio_buffer * 32767.0, -32768, 32767).astype(np.int16)
+        elif audio_buffer.dtype != np.int16:
+            audio_buffer = audio_buffer.astype(np.int16)
+        if not audio_buffer.flags["C_CONTIGUOUS"]:
+            audio_buffer = np.ascontiguousarray(audio_buffer)
 
         # Create AudioInput from buffer
         audio_input = AudioInput(buffer=audio_buffer)
@@ -128,8 +184,8 @@ class VoiceAgent:
         # Run the voice pipeline
         result = await self.pipeline.run(audio_input)
 
-        # Collect audio chunks
-        audio_chunks = []
+        # Append each chunk to one growing buffer (no per-chunk list, no final join)
+        audio_buffer_out = bytearray()
         transcribed_text = ""
 
         # Stream and optionally play the response
@@ -143,9 +199,15 @@ class VoiceAgent:
         try:
             async for event in result.stream():
                 if event.type == "voice_stream_event_audio":
-                    audio_chunks.append(event.data)
+                    # SDK emits numpy int16 arrays; += copies straight from their buffer
+                    data = event.data
+                    if isinstance(data, np.ndarray):
+                        data = np.ascontiguousarray(data)
+                        audio_buffer_out += memoryview(data).cast("B")
+                    else:
+                        audio_buffer_out += data
                     if play_response and player:
-                        player.write(event.data)
+                        player.write(data)
                 elif event.type == "voice_stream_event_transcript":
                     transcribed_text = event.text
         finally:
@@ -153,14 +215,13 @@ class VoiceAgent:
                 player.stop()
                 player.close()
 
-        # Combine all audio chunks (SDK emits numpy int16 arrays)
-        audio_response = b"".join(
-            c.tobytes() if isinstance(c, np.ndarray) else bytes(c) for c in audio_chunks
-        )
+        # Hand back a view rather than copying the whole reply into bytes
+        audio_response = memoryview(audio_buffer_out)
 
-        console.print(f"[green]✓ Transcription:[/green] {transcribed_text}")
-        console.print(
-            f"[green]✓ Generated {len(audio_response)} bytes of audio[/green]")
+        # Per-turn detail goes to the logger; the interactive loop prints the transcript
+        logger.debug(
+            "Transcription: %s (%s bytes of audio)", transcribed_text, len(audio_response)
+        )
 
         return transcribed_text, audio_response
 
@@ -195,6 +256,84 @@ class VoiceAgent:
         console.print("[green]✓ Recording complete[/green]")
         return recording.flatten()
 
+    async def record_audio_stream(
+        self, chunk_duration: float = 0.1
+    ) -> AsyncIterator[np.ndarray]:
+        """
+        Stream microphone audio as it is captured.
+
+        Args:
+            chunk_duration: Length of each yielded chunk in seconds
+
+        Yields:
+            Mono 24 kHz int16 chunks, in capture order
+        """
+        if sd is None:
+            raise RuntimeError(
+                "PortAudio/sounddevice not available (e.g. serverless). "
+                "Recording requires a local audio device."
+            )
+        sample_rate = 24000  # OpenAI Agents SDK uses 24kHz
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[np.ndarray] = asyncio.Queue()
+
+        def callback(indata, frames, time_info, status):
+            # Runs on the PortAudio thread, which reuses indata after returning
+            loop.call_soon_threadsafe(queue.put_nowait, indata[:, 0].copy())
+
+        with sd.InputStream(
+            samplerate=sample_rate,
+            channels=1,
+            dtype=np.int16,
+            blocksize=int(sample_rate * chunk_duration),
+            callback=callback,
+        ):
+            while True:
+                yield await queue.get()
+
+    async def record_utterance(self, max_duration: Optional[float] = None) -> np.ndarray:
+        """
+        Record from the microphone until the speaker pauses.
+
+        Capture stops once ``silence_duration`` seconds of audio below
+        ``silence_threshold`` follow speech, so the pipeline starts as soon as
+        the user stops talking instead of after a fixed recording window.
+
+        Args:
+            max_duration: Hard cap in seconds (defaults to ``record_seconds``)
+
+        Returns:
+            Audio data as numpy array
+        """
+        if max_duration is None:
+            max_duration = self.settings.record_seconds
+        max_samples = int(max_duration * 24000)
+        silence_energy = float(self.settings.silence_threshold) ** 2
+        silence_samples = int(self.settings.silence_duration * 24000)
+
+        console.print("[bold green]🎤 Listening...[/bold green]")
+        chunks: list[np.ndarray] = []
+        total = 0
+        quiet = 0
+        heard_speech = False
+        async with aclosing(self.record_audio_stream()) as stream:
+            async for chunk in stream:
+                chunks.append(chunk)
+                total += chunk.size
+                samples = chunk.astype(np.float64)
+                if samples.dot(samples) > silence_energy * chunk.size:
+                    heard_speech = True
+                    quiet = 0
+                elif heard_speech:
+                    quiet += chunk.size
+                    if quiet >= silence_samples:
+                        break
+                if total >= max_samples:
+                    break
+
+        console.print("[green]✓ Recording complete[/green]")
+        return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int16)
+
     async def run_conversation(self, max_turns: Optional[int] = None):
         """
         Run a continuous voice conversation.
@@ -217,11 +356,15 @@ class VoiceAgent:
                 console.print(
                     f"\n[bold white]═══ Turn {turn} ═══[/bold white]\n")
 
-                # Record audio
-                audio_buffer = self.record_audio(duration=5)
+                # Record until the user stops speaking
+                audio_buffer = await self.record_utterance()
 
                 # Process through pipeline
-                await self.process_voice_input(audio_buffer, play_response=True)
+                console.print("[bold green]🎤 Processing voice input...[/bold green]")
+                transcribed_text, _ = await self.process_voice_input(
+                    audio_buffer, play_response=True
+                )
+                console.print(f"[green]✓ Transcription:[/green] {transcribed_text}")
 
                 console.print("")
 
@@ -235,6 +378,38 @@ class VoiceAgent:
         finally:
             console.print(f"\n[dim]Total turns: {turn}[/dim]\n")
 
+    def _response_cache_key(self, user_message: str) -> Optional[tuple]:
+        """Cache key for a message, or None when sampling makes replies non-deterministic."""
+        if self.settings.temperature != 0:
+            return None
+        return (
+            self.settings.llm_model,
+            self._instructions_digest,
+            self.settings.max_tokens,
+            user_message,
+        )
+
+    async def chat_text_stream(self, user_message: str) -> AsyncIterator[str]:
+        """
+        Stream the agent's text response as the LLM generates it.
+
+        Args:
+            user_message: User's text message
+
+        Yields:
+            Text deltas, in order, as they arrive from the model
+        """
+        result = Runner.run_streamed(
+            starting_agent=self.agent,
+            input=user_message,
+        )
+        async for event in result.stream_events():
+            if event.type == "raw_response_event" and isinstance(
+                event.data, ResponseTextDeltaEvent
+            ):
+                if event.data.delta:
+                    yield event.data.delta
+
     async def chat_text(self, user_message: str, speak_response: bool = True) -> str:
         """
         Process a text message and get agent response using OpenAI Agents SDK.
@@ -246,44 +421,26 @@ class VoiceAgent:
         Returns:
             Agent's text response
         """
-        console.print(f"[bold cyan]💬 You:[/bold cyan] {user_message}")
+        logger.debug("You: %s", user_message)
 
         try:
-            # Use Runner.run() to process text through the agent
-            # This is the correct way to run an agent in OpenAI Agents SDK
-            result = await Runner.run(
-                starting_agent=self.agent,
-                input=user_message
+            cache_key = self._response_cache_key(user_message)
+            response_text = (
+                self.response_cache.get(cache_key) if cache_key is not None else None
             )
-
-            # Extract text response from agent result
-            # RunResult has a final_output attribute
-            response_text = ""
-
-            # Try to extract the final output text
-            if hasattr(result, "final_output"):
-                response_text = result.final_output or ""
-            elif hasattr(result, "messages") and result.messages:
-                # Get the last message which should be the assistant's response
-                last_message = result.messages[-1]
-                if hasattr(last_message, "content"):
-                    response_text = last_message.content or ""
-                elif isinstance(last_message, dict):
-                    response_text = last_message.get("content", "")
-            elif hasattr(result, "content") and result.content:
-                response_text = result.content
-            elif isinstance(result, str):
-                response_text = result
-            elif hasattr(result, "text"):
-                response_text = result.text
-            else:
-                # Fallback: convert to string
-                response_text = str(result)
+            if response_text is None:
+                # Collect the streamed deltas; callers that can render incrementally
+                # should use chat_text_stream() directly.
+                response_text = "".join(
+                    [delta async for delta in self.chat_text_stream(user_message)]
+                )
+                if cache_key is not None and response_text.strip():
+                    self.response_cache[cache_key] = response_text
 
             if not response_text or response_text.strip() == "":
                 response_text = "I apologize, but I couldn't generate a response. Please try again."
 
-            console.print(f"[bold green]🤖 Agent:[/bold green] {response_text}")
+            logger.debug("Agent: %s", response_text)
 
             # Synthesize and play voice if requested
             if speak_response and response_text:
@@ -292,9 +449,7 @@ class VoiceAgent:
             return response_text
 
         except Exception as e:
-            console.print(f"[bold red]✗ Error:[/bold red] {str(e)}")
-            import traceback
-            console.print(f"[red]{traceback.format_exc()}[/red]")
+            logger.exception("Text chat failed: %s", e)
             raise
 
     async def _synthesize_and_play(self, text: str):
@@ -304,9 +459,6 @@ class VoiceAgent:
         Args:
             text: Text to synthesize
         """
-        from agents.voice import TTSModelSettings
-        import io
-
         try:
             console.print("[dim]🎵 Generating speech...[/dim]")
 
@@ -330,16 +482,20 @@ class VoiceAgent:
 
                         audio_io = io.BytesIO(audio_data)
                         audio_array, sample_rate = sf.read(audio_io, dtype="float32")
-                        if len(audio_array.shape) > 1:
-                            audio_array = audio_array[:, 0]
-                        max_val = abs(audio_array).max() if len(audio_array) > 0 else 1.0
-                        if max_val > 0:
-                            audio_array = audio_array / max_val
+                        if audio_array.ndim > 1:
+                            # Mean downmix straight into a new float32 mono array
+                            audio_array = audio_array.mean(axis=1, dtype=np.float32)
+                        if audio_array.size:
+                            # Peak from max/min avoids the temporary |x| array; scale in place
+                            peak = max(float(audio_array.max()), -float(audio_array.min()))
+                            if peak > 0:
+                                audio_array *= np.float32(1.0 / peak)
                         console.print("[dim]🔊 Playing response...[/dim]")
                         sd.play(audio_array, samplerate=sample_rate)
                         sd.wait()
                     else:
-                        pcm = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
+                        pcm = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
+                        pcm *= np.float32(1.0 / 32768.0)
                         if len(pcm) == 0:
                             console.print("[yellow]⚠ No audio samples[/yellow]")
                             return
@@ -2,6 +2,7 @@
 
 from .groq_stt import GroqSTTModel
 from .groq_tts import GroqTTSModel
+from .http_client import aclose_http_client, get_http_client
 from .voice_provider import CustomVoiceModelProvider, GroqVoiceModelProvider
 
 __all__ = [
@@ -9,4 +10,6 @@ __all__ = [
     "GroqTTSModel",
     "GroqVoiceModelProvider",
     "CustomVoiceModelProvider",
+    "aclose_http_client",
+    "get_http_client",
 ]
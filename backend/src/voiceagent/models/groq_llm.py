@@ -1,6 +1,8 @@
 """Custom LLM model provider for Groq using LiteLLM."""
 
 import warnings
+from functools import lru_cache
+
 from agents.extensions.models.litellm_model import LitellmModel
 
 # Suppress Pydantic serialization warnings from LiteLLM
@@ -8,6 +10,7 @@ from agents.extensions.models.litellm_model import LitellmModel
 warnings.filterwarnings("ignore", category=UserWarning, module="pydantic")
 
 
+@lru_cache(maxsize=8)
 def create_groq_model(
     api_key: str,
     model: str = "llama-3.3-70b-versatile",
@@ -24,7 +27,8 @@ def create_groq_model(
         model: Model name (e.g., llama-3.3-70b-versatile)
 
     Returns:
-        LitellmModel configured for Groq
+        LitellmModel configured for Groq (memoized per api_key/model, so agents
+        rebuilt on settings changes share one instance)
     """
     # LiteLLM uses "groq/" prefix for Groq models
     litellm_model = f"groq/{model}"
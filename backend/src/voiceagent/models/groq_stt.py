@@ -4,9 +4,12 @@ import io
 import logging
 import wave
 
-from groq import Groq
+import httpx
+from groq import AsyncGroq
 from agents.voice import STTModel, STTModelSettings, AudioInput, StreamedAudioInput, StreamedTranscriptionSession
 
+from .http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,8 +17,19 @@ class GroqSTTModel(STTModel):
     """Speech-to-text model using Groq's Whisper."""
 
     def __init__(self, api_key: str, model: str = "whisper-large-v3"):
-        self.client = Groq(api_key=api_key)
+        self._api_key = api_key
         self.model = model
+        self._client: AsyncGroq | None = None
+        self._client_http: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> AsyncGroq:
+        """AsyncGroq bound to the shared connection pool of the running event loop."""
+        http_client = get_http_client()
+        if self._client is None or self._client_http is not http_client:
+            self._client = AsyncGroq(api_key=self._api_key, http_client=http_client)
+            self._client_http = http_client
+        return self._client
 
     @property
     def model_name(self) -> str:
@@ -41,7 +55,8 @@ class GroqSTTModel(STTModel):
         wav_buffer.seek(0)
         wav_buffer.name = "audio.wav"
 
-        transcription = self.client.audio.transcriptions.create(
+        # Awaited, so other sessions keep running during the Whisper round trip
+        transcription = await self.client.audio.transcriptions.create(
             file=wav_buffer,
             model=self.model,
             language=settings.language or "en",
@@ -6,17 +6,23 @@ Groq returns WAV; we extract raw int16 PCM at 24 kHz for the Agents SDK and WebS
 
 from __future__ import annotations
 
-import io
+import asyncio
+import contextlib
 import logging
 import os
-import wave
+import struct
+from functools import lru_cache
+from math import gcd
 from typing import AsyncIterator
 
 import httpx
 import numpy as np
+from scipy import signal
 
 from agents.voice import TTSModel, TTSModelSettings
 
+from .http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 # Groq PlayAI TTS voices (see Groq docs)
@@ -68,6 +74,10 @@ ORPHEUS_VOICES = frozenset(
 
 ORPHEUS_MAX_INPUT_CHARS = 200
 TARGET_SAMPLE_RATE = 24000
+# PCM pieces buffered ahead of the consumer while later ones (and the next segment) are fetched
+TTS_PREFETCH_CHUNKS = 8
+# PCM bytes per yielded chunk (~340 ms at 24 kHz mono int16); fewer, larger WebSocket frames
+TTS_CHUNK_BYTES = 16 * 1024
 
 
 def _is_orpheus_model(model: str) -> bool:
@@ -114,30 +124,111 @@ def _chunk_text_for_orpheus(text: str, max_len: int = ORPHEUS_MAX_INPUT_CHARS) -
     return [c for c in chunks if c]
 
 
-def _wav_bytes_to_pcm_int16_mono_24k(wav_bytes: bytes) -> bytes:
-    """Parse WAV bytes; return raw int16 mono PCM at 24 kHz."""
-    bio = io.BytesIO(wav_bytes)
-    with wave.open(bio, "rb") as wf:
-        n_channels = wf.getnchannels()
-        sample_rate = wf.getframerate()
-        sampwidth = wf.getsampwidth()
-        n_frames = wf.getnframes()
-        raw = wf.readframes(n_frames)
+@lru_cache(maxsize=16)
+def _resample_filter(up: int, down: int) -> np.ndarray:
+    """Low-pass FIR for an up/down ratio; same design as resample_poly's default, built once."""
+    max_rate = max(up, down)
+    return signal.firwin(2 * 10 * max_rate + 1, 1.0 / max_rate, window=("kaiser", 5.0))
+
+
+def resample_int16(
+    audio: np.ndarray, sample_rate: int, target_rate: int = TARGET_SAMPLE_RATE
+) -> np.ndarray:
+    """Resample int16 PCM with a polyphase filter (O(N * taps), no full-length FFT)."""
+    if sample_rate == target_rate:
+        return audio
+
+    g = gcd(sample_rate, target_rate)
+    up, down = target_rate // g, sample_rate // g
+    resampled = signal.resample_poly(
+        audio.astype(np.float64), up, down, window=_resample_filter(up, down)
+    )
+    return np.clip(resampled, -32768, 32767).astype(np.int16)
+
+
+# WAVE_FORMAT_PCM and WAVE_FORMAT_EXTENSIBLE (what the wave module accepts)
+_WAV_PCM_FORMATS = (0x0001, 0xFFFE)
+# Precompiled RIFF field layouts (chunk header, RIFF size, fmt fields, block align)
+_CHUNK_HEADER = struct.Struct("<4sI")
+_RIFF_SIZE = struct.Struct("<I")
+_FMT_FIELDS = struct.Struct("<HHI")
+_BLOCK_ALIGN = struct.Struct("<H")
+
+
+def _wav_layout(wav_data: bytes | bytearray, start: int = 0) -> tuple[int, int, int, int, int, int] | None:
+    """
+    Locate the fmt and data chunks of the WAV file at `start` from its header alone.
+
+    Returns:
+        (data_offset, data_size, sample_rate, channels, block_align, riff_end) as
+        declared by the header (sizes may exceed the buffer), or None if there is
+        no PCM data chunk header in the bytes available
+    """
+    if wav_data[start:start + 4] != b"RIFF" or wav_data[start + 8:start + 12] != b"WAVE":
+        return None
+    riff_end = start + 8 + _RIFF_SIZE.unpack_from(wav_data, start + 4)[0]
+    scan_end = min(riff_end, len(wav_data))
+
+    fmt = None
+    chunk_pos = start + 12
+    while chunk_pos + 8 <= scan_end:
+        chunk_id, chunk_size = _CHUNK_HEADER.unpack_from(wav_data, chunk_pos)
+        body = chunk_pos + 8
+        if chunk_id == b"fmt " and body + 16 <= scan_end:
+            audio_format, channels, sample_rate = _FMT_FIELDS.unpack_from(wav_data, body)
+            block_align = _BLOCK_ALIGN.unpack_from(wav_data, body + 12)[0]
+            if audio_format not in _WAV_PCM_FORMATS or not block_align:
+                return None
+            fmt = (sample_rate, channels, block_align)
+        elif chunk_id == b"data" and fmt:
+            return body, chunk_size, fmt[0], fmt[1], fmt[2], riff_end
+        chunk_pos = body + chunk_size + (chunk_size & 1)
+    return None
+
+
+def parse_wav(
+    wav_data: bytes | bytearray, start: int = 0
+) -> tuple[memoryview, int, int, int, int] | None:
+    """
+    Walk the RIFF chunks of the WAV file at `start` without copying its samples.
+
+    Sizes are clamped to the buffer, so truncated WAVs and streamed ones
+    (0xFFFFFFFF sizes, as written by streaming encoders) are handled.
+
+    Returns:
+        (pcm_view, sample_rate, channels, block_align, wav_end), or None if the
+        file has no PCM fmt/data chunks
+    """
+    layout = _wav_layout(wav_data, start)
+    if layout is None:
+        return None
+    data_offset, data_size, sample_rate, channels, block_align, riff_end = layout
+    wav_end = min(riff_end, len(wav_data))
+    # Clamp to what we have and to whole frames
+    data_end = min(data_offset + data_size, wav_end)
+    data_end -= (data_end - data_offset) % block_align
+    pcm_view = memoryview(wav_data)[data_offset:max(data_offset, data_end)]
+    return pcm_view, sample_rate, channels, block_align, wav_end
+
+
+def _wav_bytes_to_pcm_int16_mono_24k(wav_bytes: bytes) -> memoryview:
+    """Parse WAV bytes; return raw int16 mono PCM at 24 kHz (a view when no conversion is needed)."""
+    parsed = parse_wav(wav_bytes)
+    if parsed is None:
+        raise ValueError("Expected a PCM WAV response")
+    pcm, sample_rate, n_channels, block_align, _ = parsed
+    sampwidth = block_align // n_channels if n_channels else 0
 
     if sampwidth != 2:
         raise ValueError(f"Expected 16-bit WAV, got sampwidth={sampwidth}")
 
-    audio = np.frombuffer(raw, dtype=np.int16)
+    audio = np.frombuffer(pcm, dtype=np.int16)
     if n_channels > 1:
         audio = audio.reshape(-1, n_channels)[:, 0]
 
-    if sample_rate != TARGET_SAMPLE_RATE:
-        from scipy import signal
-
-        num_samples = int(len(audio) * TARGET_SAMPLE_RATE / sample_rate)
-        audio = signal.resample(audio.astype(np.float64), num_samples).astype(np.int16)
+    audio = resample_int16(audio, sample_rate)
 
-    return audio.tobytes()
+    return memoryview(np.ascontiguousarray(audio)).cast("B")
 
 
 class GroqTTSModel(TTSModel):
@@ -164,7 +255,10 @@ class GroqTTSModel(TTSModel):
     def model_name(self) -> str:
         return self._model
 
-    async def _speech_request(self, client: httpx.AsyncClient, input_text: str) -> bytes:
+    async def _speech_stream(
+        self, client: httpx.AsyncClient, input_text: str
+    ) -> AsyncIterator[bytes]:
+        """POST one speech request and yield the WAV response body as it arrives."""
         payload: dict = {
             "model": self._model,
             "input": input_text,
@@ -177,28 +271,74 @@ class GroqTTSModel(TTSModel):
             self._voice,
             len(input_text),
         )
-        response = await client.post(
+        async with client.stream(
+            "POST",
             f"{self._base_url}/audio/speech",
             headers={
                 "Authorization": f"Bearer {self._api_key}",
                 "Content-Type": "application/json",
             },
             json=payload,
-        )
-        if response.is_error:
-            try:
-                body = response.json()
-            except Exception:
-                body = response.text
-            logger.error(
-                "Groq TTS API error %d: model=%s voice=%s | response body: %s",
-                response.status_code,
-                self._model,
-                self._voice,
-                body,
-            )
-            response.raise_for_status()
-        return response.content
+            timeout=self._timeout,
+        ) as response:
+            if response.is_error:
+                await response.aread()
+                try:
+                    body = response.json()
+                except Exception:
+                    body = response.text
+                logger.error(
+                    "Groq TTS API error %d: model=%s voice=%s | response body: %s",
+                    response.status_code,
+                    self._model,
+                    self._voice,
+                    body,
+                )
+                response.raise_for_status()
+            async for body in response.aiter_bytes():
+                yield body
+
+    async def _segment_pcm(
+        self, client: httpx.AsyncClient, segment: str
+    ) -> AsyncIterator[bytes | memoryview]:
+        """
+        Yield one segment's int16 mono 24 kHz PCM.
+
+        When the response is already in that format, samples are forwarded as the body
+        arrives instead of after the whole WAV is downloaded; anything that needs
+        resampling or channel selection is decoded once the body is complete.
+        """
+        head = bytearray()  # response bytes until the PCM starts (or all of them)
+        streaming = False
+        decode_whole = False
+        remaining = 0  # PCM bytes the data chunk still declares
+        carry = b""  # odd trailing byte, held back so every piece is whole samples
+        async for body in self._speech_stream(client, segment):
+            if streaming:
+                pcm = carry + body
+            else:
+                head += body
+                if decode_whole:
+                    continue
+                layout = _wav_layout(head)
+                if layout is None:
+                    continue
+                data_offset, remaining, sample_rate, channels, block_align, _ = layout
+                if (sample_rate, channels, block_align) != (TARGET_SAMPLE_RATE, 1, 2):
+                    decode_whole = True
+                    continue
+                streaming = True
+                pcm = bytes(head[data_offset:])
+                head.clear()
+            pcm = pcm[:remaining]
+            usable = len(pcm) - len(pcm) % 2
+            carry = pcm[usable:]
+            if usable:
+                remaining -= usable
+                yield pcm[:usable]
+        if not streaming:
+            # Resampling a whole segment is CPU-bound; keep it off the event loop
+            yield await asyncio.to_thread(_wav_bytes_to_pcm_int16_mono_24k, bytes(head))
 
     async def run(self, text: str, settings: TTSModelSettings) -> AsyncIterator[bytes]:
         if not (text or "").strip():
@@ -208,26 +348,50 @@ class GroqTTSModel(TTSModel):
             segments = _chunk_text_for_orpheus(text.strip())
         else:
             segments = [text.strip()]
+        segments = [segment for segment in segments if segment]
+        if not segments:
+            return
 
-        chunk_size = 4096
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            for segment in segments:
-                if not segment:
-                    continue
-                try:
-                    wav_data = await self._speech_request(client, segment)
-                    pcm = _wav_bytes_to_pcm_int16_mono_24k(wav_data)
-                except Exception:
-                    logger.exception(
-                        "GroqTTSModel failed for segment (model=%s voice=%s len=%d): %r…",
-                        self._model,
-                        self._voice,
-                        len(segment),
-                        segment[:80],
-                    )
-                    raise
-                for i in range(0, len(pcm), chunk_size):
-                    yield pcm[i : i + chunk_size]
+        # Producer synthesizes segment N+1 while segment N is streamed to the caller
+        queue: asyncio.Queue = asyncio.Queue(maxsize=TTS_PREFETCH_CHUNKS)
+        producer = asyncio.create_task(self._synthesize_segments(segments, queue))
+        chunk_size = TTS_CHUNK_BYTES
+        try:
+            while True:
+                pcm = await queue.get()
+                if pcm is None:
+                    break
+                if isinstance(pcm, BaseException):
+                    raise pcm
+                # Zero-copy slices; consumers join or send them as bytes-like objects
+                pcm_view = memoryview(pcm)
+                for i in range(0, len(pcm_view), chunk_size):
+                    yield pcm_view[i : i + chunk_size]
+        finally:
+            if not producer.done():
+                producer.cancel()
+                # Wait for the cancellation so an in-flight response is closed now
+                with contextlib.suppress(asyncio.CancelledError):
+                    await producer
+
+    async def _synthesize_segments(self, segments: list[str], queue: asyncio.Queue) -> None:
+        """Request each segment in order and queue its PCM; queue None when done or the error."""
+        client = get_http_client()
+        for segment in segments:
+            try:
+                async for pcm in self._segment_pcm(client, segment):
+                    await queue.put(pcm)
+            except Exception as exc:
+                logger.exception(
+                    "GroqTTSModel failed for segment (model=%s voice=%s len=%d): %r…",
+                    self._model,
+                    self._voice,
+                    len(segment),
+                    segment[:80],
+                )
+                await queue.put(exc)
+                return
+        await queue.put(None)
 
 
 def all_supported_voices_for_model(model: str) -> frozenset[str]:
@@ -0,0 +1,53 @@
+"""Shared async HTTP client for Groq REST calls.
+
+Keeps one connection pool per event loop so TTS segments and health checks reuse
+TCP/TLS connections to api.groq.com instead of handshaking on every request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+
+import httpx
+
+# Optional HTTP/2 support (install `h2`); falls back to HTTP/1.1 keep-alive.
+try:
+    import h2  # noqa: F401
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
+DEFAULT_TIMEOUT = httpx.Timeout(120.0, connect=5.0)
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+# One client per event loop; an entry goes away with its loop, so a client is
+# never replaced (and its pool orphaned) while the loop that owns it is alive
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient for the running event loop, creating it if needed."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            limits=DEFAULT_LIMITS,
+            http2=HAS_H2,
+        )
+        _clients[loop] = client
+    return client
+
+
+async def aclose_http_client() -> None:
+    """Close the running loop's shared client (call on application shutdown)."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
@@ -0,0 +1,64 @@
+"""Tests for the /spin circuit breaker state machine."""
+
+import pytest
+
+from routes import api
+from routes.api import CircuitBreaker
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(api.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _open_breaker(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        assert breaker.allow()
+        breaker.record_failure()
+
+
+def test_closed_open_half_open_closed(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=30.0)
+    _open_breaker(breaker)
+    assert breaker.state == "OPEN"
+    assert not breaker.allow()
+
+    clock[0] += 30.0
+    assert breaker.allow()
+    assert breaker.state == "HALF_OPEN"
+    # Only one probe goes out while half-open
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == "CLOSED"
+    assert breaker.allow()
+    assert breaker.allow()
+
+
+def test_failed_probe_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=30.0)
+    _open_breaker(breaker)
+
+    clock[0] += 30.0
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "OPEN"
+    assert not breaker.allow()
+
+    clock[0] += 30.0
+    assert breaker.allow()
+    assert breaker.state == "HALF_OPEN"
+
+
+def test_unreported_probe_is_replaced_after_the_reset_window(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30.0)
+    _open_breaker(breaker)
+
+    clock[0] += 30.0
+    assert breaker.allow()
+    clock[0] += 29.0
+    assert not breaker.allow()
+    clock[0] += 1.0
+    assert breaker.allow()
@@ -0,0 +1,122 @@
+"""Tests for GroqTTSModel segment streaming."""
+
+import asyncio
+import io
+import wave
+
+import pytest
+from agents.voice import TTSModelSettings
+
+from voiceagent.models.groq_tts import GroqTTSModel
+
+
+def _wav(pcm: bytes, sample_rate: int = 24000) -> bytes:
+    bio = io.BytesIO()
+    with wave.open(bio, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm)
+    return bio.getvalue()
+
+
+def _model(fake_stream) -> GroqTTSModel:
+    model = GroqTTSModel(api_key="test-key", model="canopylabs/orpheus-v1-english")
+    model._speech_stream = fake_stream
+    return model
+
+
+async def _collect(model: GroqTTSModel, text: str, events: list[str]) -> bytes:
+    out = []
+    async for chunk in model.run(text, TTSModelSettings()):
+        events.append("yield")
+        out.append(chunk)
+        await asyncio.sleep(0.01)
+    return b"".join(out)
+
+
+def test_segments_stream_in_order_and_prefetch():
+    events: list[str] = []
+
+    async def fake_stream(client, segment):
+        events.append(f"request:{segment[0]}")
+        await asyncio.sleep(0.01)
+        yield _wav(segment[0].encode() * 2)
+
+    # Two sentences over the Orpheus input limit -> two segments
+    text = "A" + "a" * 150 + ". " + "B" + "b" * 150 + "."
+    pcm = asyncio.run(_collect(_model(fake_stream), text, events))
+
+    assert pcm == b"AABB"
+    # Second segment is already being synthesized before the first one is yielded
+    assert events.index("request:B") < events.index("yield")
+
+
+def test_segment_error_is_raised_to_consumer():
+    async def fake_stream(client, segment):
+        raise RuntimeError("tts down")
+        yield b""
+
+    with pytest.raises(RuntimeError, match="tts down"):
+        asyncio.run(_collect(_model(fake_stream), "Hello there.", []))
+
+
+def test_pcm_is_forwarded_while_the_body_downloads():
+    events: list[str] = []
+    pcm = bytes(range(256)) * 4
+    wav = _wav(pcm)
+
+    async def fake_stream(client, segment):
+        # Header split mid-chunk and odd-sized pieces (samples straddle pieces)
+        for start, end in ((0, 30), (30, 301), (301, 777), (777, len(wav))):
+            events.append("body")
+            yield wav[start:end]
+            await asyncio.sleep(0.01)
+
+    out = asyncio.run(_collect(_model(fake_stream), "Hello there.", events))
+
+    assert out == pcm
+    assert events.index("yield") < len(events) - 1 - events[::-1].index("body")
+
+
+def test_other_rates_are_decoded_after_download():
+    async def fake_stream(client, segment):
+        wav = _wav(b"\x00\x10" * 4800, sample_rate=48000)
+        yield wav[:100]
+        yield wav[100:]
+
+    out = asyncio.run(_collect(_model(fake_stream), "Hello there.", []))
+
+    assert abs(len(out) // 2 - 2400) <= 1
+
+
+def test_stopping_early_waits_for_the_producer():
+    closed: list[bool] = []
+    producers: list[asyncio.Task] = []
+
+    async def fake_stream(client, segment):
+        try:
+            yield _wav(b"\x01\x00" * 8)
+            await asyncio.sleep(10)  # response still downloading
+            yield b""
+        finally:
+            closed.append(True)
+
+    model = _model(fake_stream)
+    synthesize = model._synthesize_segments
+
+    async def tracked_synthesize(segments, queue):
+        producers.append(asyncio.current_task())
+        await synthesize(segments, queue)
+
+    model._synthesize_segments = tracked_synthesize
+
+    async def main():
+        stream = model.run("Hello there.", TTSModelSettings())
+        async for _chunk in stream:
+            break
+        await stream.aclose()
+        assert producers[0].done()
+        assert closed == [True]
+
+    asyncio.run(main())
@@ -0,0 +1,40 @@
+"""Tests for the shared per-event-loop HTTP client."""
+
+import asyncio
+import gc
+
+from voiceagent.models import http_client
+
+
+def test_client_is_reused_within_a_loop_and_closed_on_shutdown():
+    async def main():
+        first = http_client.get_http_client()
+        assert http_client.get_http_client() is first
+        await http_client.aclose_http_client()
+        assert first.is_closed
+        second = http_client.get_http_client()
+        assert second is not first
+        await http_client.aclose_http_client()
+
+    asyncio.run(main())
+
+
+def test_each_loop_keeps_its_own_client():
+    async def outer():
+        client = http_client.get_http_client()
+        # A second loop (e.g. in a worker thread) must not replace this loop's client
+        inner = await asyncio.to_thread(asyncio.run, _inner_client())
+        assert inner is not client
+        assert http_client.get_http_client() is client
+        assert not client.is_closed
+        await http_client.aclose_http_client()
+
+    asyncio.run(outer())
+    gc.collect()
+    assert len(http_client._clients) == 0
+
+
+async def _inner_client():
+    client = http_client.get_http_client()
+    await http_client.aclose_http_client()
+    return client
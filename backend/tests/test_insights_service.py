@@ -0,0 +1,60 @@
+"""Tests for field distribution stats in the insights service."""
+
+import uuid
+
+from v1.models import Answer, Form, Organization, RespondentSession, Submission
+from v1.services.insights_service import compute_field_distributions
+
+
+def _seed_form(db_session):
+    org = Organization(id=str(uuid.uuid4()), name="Test Org")
+    db_session.add(org)
+    form = Form(
+        id=str(uuid.uuid4()),
+        org_id=org.id,
+        title="Feedback",
+        slug=f"feedback-{uuid.uuid4().hex[:8]}",
+        status="published",
+        fields_schema=[
+            {"name": "rating", "type": "number", "description": "Rating"},
+            {"name": "platform", "type": "select", "description": "Platform"},
+            {"name": "comment", "type": "text", "description": "Comment"},
+        ],
+    )
+    db_session.add(form)
+    db_session.commit()
+    return form
+
+
+def _answer(db_session, form, answers: dict[str, str]):
+    rs = RespondentSession(id=str(uuid.uuid4()), form_id=form.id, channel="chat", status="completed")
+    db_session.add(rs)
+    for key, value in answers.items():
+        db_session.add(Answer(session_id=rs.id, form_id=form.id, field_key=key, value_text=value))
+    db_session.add(Submission(form_id=form.id, session_id=rs.id))
+    db_session.commit()
+
+
+def test_distributions_are_partitioned_per_field(db_session):
+    form = _seed_form(db_session)
+    _answer(db_session, form, {"rating": "4", "platform": "PC"})
+    _answer(db_session, form, {"rating": "8", "platform": "PC"})
+    _answer(db_session, form, {"rating": "8", "platform": "Console"})
+
+    result = compute_field_distributions(db_session, form)
+
+    assert result.total_submissions == 3
+    by_key = {f.field_key: f.stats for f in result.fields}
+
+    rating = by_key["rating"]
+    assert rating.parseable_count == 3
+    assert rating.min_val == 4
+    assert rating.max_val == 8
+
+    platform = by_key["platform"]
+    assert platform.total_responses == 3
+    assert [(vc.value, vc.count) for vc in platform.value_counts] == [("PC", 2), ("Console", 1)]
+
+    comment = by_key["comment"]
+    assert comment.total_responses == 0
+    assert comment.top_values == []
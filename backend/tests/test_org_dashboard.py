@@ -0,0 +1,67 @@
+"""Tests for the org dashboard aggregates."""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func
+
+import v1.routes.forms as forms_routes
+from v1.models import AdminUser, Form, Membership, Organization, RespondentSession, Submission
+from v1.routes.forms import org_dashboard
+
+
+@pytest.fixture(autouse=True)
+def sqlite_day_bucket(monkeypatch):
+    """SQLite returns CAST(... AS DATE) as a bare year; bucket days with date() instead."""
+    monkeypatch.setattr(forms_routes, "cast", lambda col, _type: func.date(col))
+
+
+def test_dashboard_counts_and_trends(db_session):
+    org = Organization(id=str(uuid.uuid4()), name="Test Org")
+    admin = AdminUser(id=str(uuid.uuid4()), email="dash@example.com", password_hash="x")
+    db_session.add_all([org, admin])
+    db_session.add(Membership(org_id=org.id, admin_user_id=admin.id))
+    form = Form(
+        id=str(uuid.uuid4()),
+        org_id=org.id,
+        title="Dashboard form",
+        slug=f"dash-{uuid.uuid4().hex[:8]}",
+        status="published",
+        fields_schema=[],
+    )
+    db_session.add(form)
+
+    now = datetime.utcnow()
+    # (session age in days, submitted?)
+    for age_days, submitted in [(1, True), (2, True), (3, False), (10, True), (11, False)]:
+        created = now - timedelta(days=age_days)
+        rs = RespondentSession(
+            id=str(uuid.uuid4()),
+            form_id=form.id,
+            channel="chat",
+            status="completed" if submitted else "active",
+            created_at=created,
+        )
+        db_session.add(rs)
+        if submitted:
+            db_session.add(Submission(
+                form_id=form.id,
+                session_id=rs.id,
+                completed_at=created + timedelta(minutes=5),
+            ))
+    db_session.commit()
+
+    result = org_dashboard(org.id, db=db_session, current_user=admin)
+
+    assert result.total_submissions == 3
+    assert result.total_sessions == 5
+    assert result.completion_rate_pct == 60.0
+    assert result.submissions_last_7d == 2
+    assert result.submissions_prev_7d == 1
+    assert result.submissions_trend_pct == 100.0
+    # last 7d: 2 of 3 sessions completed; previous 7d: 1 of 2
+    assert result.completion_rate_trend_pct == round(66.7 - 50.0, 1)
+    assert result.avg_completion_seconds is not None
+    assert round(result.avg_completion_seconds) == 300
+    assert result.published_forms == 1
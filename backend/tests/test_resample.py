@@ -0,0 +1,33 @@
+"""Tests for int16 PCM resampling used by STT input and Groq TTS output."""
+
+import numpy as np
+
+from voiceagent.models.groq_tts import resample_int16
+
+
+def _tone(sample_rate: int, seconds: float = 1.0, freq: float = 440.0) -> np.ndarray:
+    t = np.arange(int(sample_rate * seconds)) / sample_rate
+    return (np.sin(2 * np.pi * freq * t) * 10000).astype(np.int16)
+
+
+def test_same_rate_is_passthrough():
+    audio = _tone(24000)
+    assert resample_int16(audio, 24000) is audio
+
+
+def test_downsample_keeps_length_and_tone():
+    for rate in (48000, 44100, 16000):
+        out = resample_int16(_tone(rate), rate)
+        assert out.dtype == np.int16
+        assert abs(len(out) - 24000) <= 1
+        expected = _tone(24000)[:len(out)]
+        # Ignore filter edge effects at both ends
+        assert np.abs(out[500:-500].astype(int) - expected[500:-500]).max() < 50
+
+
+def test_output_is_clipped_not_wrapped():
+    square = np.tile(np.array([32767] * 50 + [-32768] * 50, dtype=np.int16), 480)
+    out = resample_int16(square, 48000)
+    # Overshoot from the filter must saturate at the int16 limits, never wrap sign
+    assert out.max() == 32767
+    assert out.min() == -32768
@@ -0,0 +1,18 @@
+"""Tests for VoiceService settings isolation."""
+
+from services.voice_service import VoiceService
+from voiceagent import get_settings
+
+
+def test_update_settings_does_not_touch_cached_settings(monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    monkeypatch.setenv("TEMPERATURE", "0.7")
+    get_settings.cache_clear()
+    try:
+        service = VoiceService()
+        service.update_settings(temperature=0)
+
+        assert service.settings.temperature == 0
+        assert get_settings().temperature == 0.7
+    finally:
+        get_settings.cache_clear()
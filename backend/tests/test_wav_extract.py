@@ -0,0 +1,39 @@
+"""Tests for PCM extraction from (concatenated) WAV responses."""
+
+import io
+import struct
+import wave
+
+from services.voice_service import VoiceService
+
+
+def _wav(pcm: bytes, rate: int = 24000) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(rate)
+        wav_file.writeframes(pcm)
+    return buf.getvalue()
+
+
+def test_concatenated_wavs_are_joined():
+    first, second = b"\x01\x00" * 100, b"\x02\x00" * 57
+    assert VoiceService._extract_pcm_from_wav(_wav(first) + _wav(second)) == first + second
+
+
+def test_extra_chunks_and_streamed_sizes():
+    pcm = b"\x03\x00" * 40
+    wav = _wav(pcm)
+    # Insert an odd-sized LIST chunk before "fmt " and mark sizes as unknown (streamed)
+    extra = b"LIST" + struct.pack("<I", 3) + b"abc\x00"
+    wav = b"RIFF" + b"\xff\xff\xff\xff" + b"WAVE" + extra + wav[12:]
+    data_at = wav.index(b"data")
+    wav = wav[:data_at + 4] + b"\xff\xff\xff\xff" + wav[data_at + 8:]
+    assert VoiceService._extract_pcm_from_wav(wav) == pcm
+
+
+def test_truncated_frame_and_garbage():
+    pcm = b"\x04\x00" * 10
+    assert VoiceService._extract_pcm_from_wav(_wav(pcm)[:-1]) == pcm[:-2]
+    assert VoiceService._extract_pcm_from_wav(b"not a wav") is None
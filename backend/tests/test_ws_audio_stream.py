@@ -0,0 +1,45 @@
+"""Tests for the /ws TTS audio forwarder."""
+
+import asyncio
+
+import pytest
+
+from routes import websocket as ws
+
+
+class _SlowSocket:
+    def __init__(self, fail: bool = False):
+        self.frames: list[bytes] = []
+        self.fail = fail
+
+    async def send_bytes(self, data: bytes) -> None:
+        await asyncio.sleep(0.005)
+        if self.fail:
+            raise RuntimeError("client gone")
+        self.frames.append(data)
+
+
+async def _chunks(count: int, produced: list[int]):
+    for i in range(count):
+        produced.append(i)
+        yield bytes([i])
+
+
+def test_slow_client_backs_up_the_producer(monkeypatch):
+    monkeypatch.setattr(ws, "AUDIO_QUEUE_MAXSIZE", 4)
+    socket, produced = _SlowSocket(), []
+
+    count = asyncio.run(ws._send_audio_stream(socket, _chunks(40, produced)))
+
+    assert count == 40
+    assert b"".join(socket.frames) == bytes(range(40))
+    assert len(socket.frames) > 1
+
+
+def test_failed_send_stops_the_producer(monkeypatch):
+    monkeypatch.setattr(ws, "AUDIO_QUEUE_MAXSIZE", 4)
+    socket, produced = _SlowSocket(fail=True), []
+
+    with pytest.raises(RuntimeError, match="client gone"):
+        asyncio.run(ws._send_audio_stream(socket, _chunks(1000, produced)))
+    assert len(produced) < 20
@@ -7,12 +7,13 @@ import hashlib
 import json
 import uuid
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 
 import io
 
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
-from sqlalchemy import Date, cast, extract, func, select
+from sqlalchemy import Date, case, cast, extract, func, select
 from sqlalchemy.orm import Session
 
 from ..database import get_db
@@ -200,48 +201,61 @@ def org_dashboard(
             recent_submissions=[],
         )
 
-    total_submissions = db.scalar(
-        select(func.count()).select_from(Submission).where(Submission.form_id.in_(form_ids))
-    )
-    total_submissions = int(total_submissions or 0)
-
-    total_sessions = db.scalar(
-        select(func.count())
-        .select_from(RespondentSession)
-        .where(RespondentSession.form_id.in_(form_ids))
-    )
-    total_sessions = int(total_sessions or 0)
-
-    completion_rate_pct = round(100.0 * total_submissions / total_sessions, 1) if total_sessions else 0.0
-
     now = datetime.utcnow()
     boundary_7d = now - timedelta(days=7)
     boundary_14d = now - timedelta(days=14)
 
-    submissions_last_7d = int(
-        db.scalar(
-            select(func.count())
-            .select_from(Submission)
-            .where(
-                Submission.form_id.in_(form_ids),
-                Submission.completed_at >= boundary_7d,
-            )
+    # Headline counters in two round trips (submissions, sessions) using
+    # conditional aggregates instead of one COUNT query per figure.
+    sub_last_7d = Submission.completed_at >= boundary_7d
+    sub_prev_7d = (Submission.completed_at >= boundary_14d) & (Submission.completed_at < boundary_7d)
+    has_session = RespondentSession.id.is_not(None)
+    (
+        total_submissions,
+        submissions_last_7d,
+        submissions_prev_7d,
+        completed_last,
+        completed_prev,
+        avg_raw,
+    ) = db.execute(
+        select(
+            func.count(Submission.id),
+            func.count(case((sub_last_7d, 1))),
+            func.count(case((sub_prev_7d, 1))),
+            func.count(case((has_session & sub_last_7d, 1))),
+            func.count(case((has_session & sub_prev_7d, 1))),
+            func.avg(
+                extract("epoch", Submission.completed_at)
+                - extract("epoch", RespondentSession.created_at)
+            ),
         )
-        or 0
-    )
+        .select_from(Submission)
+        .outerjoin(RespondentSession, RespondentSession.id == Submission.session_id)
+        .where(Submission.form_id.in_(form_ids))
+    ).one()
+    total_submissions = int(total_submissions or 0)
+    submissions_last_7d = int(submissions_last_7d or 0)
+    submissions_prev_7d = int(submissions_prev_7d or 0)
+    completed_last = int(completed_last or 0)
+    completed_prev = int(completed_prev or 0)
 
-    submissions_prev_7d = int(
-        db.scalar(
-            select(func.count())
-            .select_from(Submission)
-            .where(
-                Submission.form_id.in_(form_ids),
-                Submission.completed_at >= boundary_14d,
-                Submission.completed_at < boundary_7d,
-            )
+    total_sessions, sessions_last, sessions_prev = db.execute(
+        select(
+            func.count(RespondentSession.id),
+            func.count(case((RespondentSession.created_at >= boundary_7d, 1))),
+            func.count(case((
+                (RespondentSession.created_at >= boundary_14d)
+                & (RespondentSession.created_at < boundary_7d),
+                1,
+            ))),
         )
-        or 0
-    )
+        .where(RespondentSession.form_id.in_(form_ids))
+    ).one()
+    total_sessions = int(total_sessions or 0)
+    sessions_last = int(sessions_last or 0)
+    sessions_prev = int(sessions_prev or 0)
+
+    completion_rate_pct = round(100.0 * total_submissions / total_sessions, 1) if total_sessions else 0.0
 
     if submissions_prev_7d > 0:
         submissions_trend_pct = round(
@@ -253,56 +267,7 @@ def org_dashboard(
     else:
         submissions_trend_pct = None
 
-    completed_prev = int(
-        db.scalar(
-            select(func.count())
-            .select_from(Submission)
-            .join(RespondentSession, RespondentSession.id == Submission.session_id)
-            .where(
-                Submission.form_id.in_(form_ids),
-                Submission.completed_at >= boundary_14d,
-                Submission.completed_at < boundary_7d,
-            )
-        )
-        or 0
-    )
-    sessions_prev = int(
-        db.scalar(
-            select(func.count())
-            .select_from(RespondentSession)
-            .where(
-                RespondentSession.form_id.in_(form_ids),
-                RespondentSession.created_at < boundary_7d,
-                RespondentSession.created_at >= boundary_14d,
-            )
-        )
-        or 0
-    )
     rate_prev = round(100.0 * completed_prev / sessions_prev, 1) if sessions_prev else 0.0
-
-    completed_last = int(
-        db.scalar(
-            select(func.count())
-            .select_from(Submission)
-            .join(RespondentSession, RespondentSession.id == Submission.session_id)
-            .where(
-                Submission.form_id.in_(form_ids),
-                Submission.completed_at >= boundary_7d,
-            )
-        )
-        or 0
-    )
-    sessions_last = int(
-        db.scalar(
-            select(func.count())
-            .select_from(RespondentSession)
-            .where(
-                RespondentSession.form_id.in_(form_ids),
-                RespondentSession.created_at >= boundary_7d,
-            )
-        )
-        or 0
-    )
     rate_last = round(100.0 * completed_last / sessions_last, 1) if sessions_last else 0.0
 
     if sessions_prev > 0 or sessions_last > 0:
@@ -310,17 +275,6 @@ def org_dashboard(
     else:
         completion_rate_trend_pct = None
 
-    avg_raw = db.scalar(
-        select(
-            func.avg(
-                extract("epoch", Submission.completed_at)
-                - extract("epoch", RespondentSession.created_at)
-            )
-        )
-        .select_from(Submission)
-        .join(RespondentSession, RespondentSession.id == Submission.session_id)
-        .where(Submission.form_id.in_(form_ids))
-    )
     avg_completion_seconds = float(avg_raw) if avg_raw is not None else None
 
     channel_rows = db.execute(
@@ -975,10 +929,11 @@ FORM_TEMPLATES = [
 ]
 
 
-@router.get("/templates", response_model=list[FormTemplateResponse])
-def list_templates():
-    return [
-        FormTemplateResponse(
+@lru_cache(maxsize=1)
+def _template_responses() -> dict[str, FormTemplateResponse]:
+    """Build the template responses once; FORM_TEMPLATES is static."""
+    return {
+        t["id"]: FormTemplateResponse(
             id=t["id"],
             title=t["title"],
             description=t["description"],
@@ -989,24 +944,20 @@ def list_templates():
             mode=t["mode"],
         )
         for t in FORM_TEMPLATES
-    ]
+    }
+
+
+@router.get("/templates", response_model=list[FormTemplateResponse])
+def list_templates():
+    return list(_template_responses().values())
 
 
 @router.get("/templates/{template_id}", response_model=FormTemplateResponse)
 def get_template(template_id: str):
-    for t in FORM_TEMPLATES:
-        if t["id"] == template_id:
-            return FormTemplateResponse(
-                id=t["id"],
-                title=t["title"],
-                description=t["description"],
-                category=t["category"],
-                fields=[FormField(**f) for f in t["fields"]],
-                system_prompt=t["system_prompt"],
-                persona=t["persona"],
-                mode=t["mode"],
-            )
-    raise HTTPException(status_code=404, detail="Template not found")
+    template = _template_responses().get(template_id)
+    if template is None:
+        raise HTTPException(status_code=404, detail="Template not found")
+    return template
 
 
 # ---------------------------------------------------------------------------
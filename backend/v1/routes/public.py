@@ -5,12 +5,19 @@ Uses the agentic form engine (OpenAI Agents SDK) for conversation.
 
 from __future__ import annotations
 
-import base64
+import asyncio
 import json
 import logging
 import time
 
 import numpy as np
+import orjson
+
+# SIMD base64 when installed (`pybase64`); drop-in for the stdlib module
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
 
 from fastapi import APIRouter, Depends, Header, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.responses import StreamingResponse
@@ -38,6 +45,13 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/public", tags=["v1-public"])
 
+# PCM bytes per outgoing voice frame; larger frames mean fewer sends per reply
+VOICE_AUDIO_CHUNK_BYTES = 16 * 1024
+
+# Constant voice control messages, serialized once at import
+_CONNECTED_FRAME = orjson.dumps({"type": "state", "data": "connected"}).decode()
+_AUDIO_END_FRAME = orjson.dumps({"type": "audio_end"}).decode()
+
 
 # ---------------------------------------------------------------------------
 # Create session
@@ -251,32 +265,57 @@ async def public_voice_session(websocket: WebSocket, session_id: str):
     """Voice websocket for session-bound runtime using the agent engine.
 
     Protocol:
-    - client sends JSON {type:"auth", token:"..."}
+    - client sends JSON {type:"auth", token:"...", binary?: true}
     - client streams {type:"audio_chunk", data:"base64"} and then {type:"stop"}
     - server responds with transcription + assistant_message + audio
+    - with binary: true, audio travels as raw binary frames in both directions
+      instead of base64 audio_chunk messages; JSON frames stay control-only
     """
 
     await websocket.accept()
     db = SessionLocal()
-    audio_chunks: list[bytes] = []
+    audio_buffer = bytearray()
     authed = False
+    binary_audio = False
     voice_start_time: float | None = None
 
+    async def send_json(message: dict) -> None:
+        # orjson instead of Starlette's stdlib-json send_json; same text frame on the wire
+        await websocket.send_text(orjson.dumps(message).decode())
+
+    async def send_audio(pcm_chunk: bytes) -> None:
+        if binary_audio:
+            await websocket.send_bytes(pcm_chunk)
+        else:
+            encoded = base64.b64encode(pcm_chunk).decode("ascii")
+            await send_json({"type": "audio_chunk", "data": encoded})
+
     try:
         voice_service = websocket.app.state.voice_service if hasattr(websocket.app.state, "voice_service") else None
 
         while True:
-            payload = await websocket.receive_json()
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code", 1000))
+            if frame.get("bytes") is not None:
+                # Binary frames are raw recorded audio for the current turn
+                if authed:
+                    audio_buffer.extend(frame["bytes"])
+                else:
+                    await send_json({"type": "error", "data": "Authenticate first"})
+                continue
+            payload = orjson.loads(frame["text"])
             msg_type = payload.get("type")
 
             if msg_type == "auth":
                 token = payload.get("token", "")
                 claims = decode_token(token)
                 if claims.get("type") != "public_session" or claims.get("sid") != session_id:
-                    await websocket.send_json({"type": "error", "data": "Invalid session token"})
+                    await send_json({"type": "error", "data": "Invalid session token"})
                     await websocket.close(code=4401)
                     return
                 authed = True
+                binary_audio = bool(payload.get("binary"))
                 voice_start_time = time.time()
 
                 # Send initial prompt via agent engine
@@ -295,8 +334,8 @@ async def public_voice_session(websocket: WebSocket, session_id: str):
                         prompt = await generate_initial_greeting(db, respondent_session)
                         db.commit()
 
-                    await websocket.send_json({"type": "state", "data": "connected"})
-                    await websocket.send_json({
+                    await websocket.send_text(_CONNECTED_FRAME)
+                    await send_json({
                         "type": "assistant_message",
                         "data": prompt,
                         "state": "active",
@@ -306,46 +345,46 @@ async def public_voice_session(websocket: WebSocket, session_id: str):
                     if voice_service:
                         try:
                             async for pcm_chunk in voice_service.synthesize_speech(prompt):
-                                encoded = base64.b64encode(pcm_chunk).decode("ascii")
-                                await websocket.send_json({"type": "audio_chunk", "data": encoded})
+                                await send_audio(pcm_chunk)
                         except Exception as tts_err:
                             logger.exception("Greeting TTS failed: %s", tts_err)
                         finally:
-                            await websocket.send_json({"type": "audio_end"})
+                            await websocket.send_text(_AUDIO_END_FRAME)
                     else:
-                        await websocket.send_json({"type": "audio_end"})
+                        await websocket.send_text(_AUDIO_END_FRAME)
 
                 else:
-                    await websocket.send_json({"type": "state", "data": "connected"})
-                    await websocket.send_json({"type": "audio_end"})
+                    await websocket.send_text(_CONNECTED_FRAME)
+                    await websocket.send_text(_AUDIO_END_FRAME)
                 continue
 
             if not authed:
-                await websocket.send_json({"type": "error", "data": "Authenticate first"})
+                await send_json({"type": "error", "data": "Authenticate first"})
                 continue
 
             if msg_type == "start_recording":
                 # Clear any orphaned chunks from a prior turn (belt-and-suspenders with client timing).
-                audio_chunks = []
+                audio_buffer = bytearray()
                 continue
 
             if msg_type == "audio_chunk":
                 try:
-                    audio_chunks.append(base64.b64decode(payload.get("data", "")))
+                    audio_buffer.extend(base64.b64decode(payload.get("data", "")))
                 except Exception:
-                    await websocket.send_json({"type": "error", "data": "Invalid audio chunk"})
+                    await send_json({"type": "error", "data": "Invalid audio chunk"})
                 continue
 
             if msg_type == "stop":
                 transcript_override = (payload.get("transcript") or "").strip()
                 respondent_session = db.get(RespondentSession, session_id)
                 if not respondent_session:
-                    await websocket.send_json({"type": "error", "data": "Session not found"})
+                    await send_json({"type": "error", "data": "Session not found"})
                     await websocket.close(code=4404)
                     return
 
-                combined_audio = b"".join(audio_chunks)
-                audio_chunks = []
+                # Hand the buffer over as-is (no join copy) and start a fresh one
+                combined_audio = audio_buffer
+                audio_buffer = bytearray()
 
                 # Text-only turn (optional client hint): skip STT pipeline
                 if not combined_audio and transcript_override and voice_service:
@@ -354,10 +393,10 @@ async def public_voice_session(websocket: WebSocket, session_id: str):
                             db, respondent_session, transcript_override
                         )
                         db.commit()
-                        await websocket.send_json(
+                        await send_json(
                             {"type": "transcription", "data": transcript_override}
                         )
-                        await websocket.send_json(
+                        await send_json(
                             {
                                 "type": "assistant_message",
                                 "data": result.assistant_message,
@@ -369,36 +408,37 @@ async def public_voice_session(websocket: WebSocket, session_id: str):
                             async for pcm_chunk in voice_service.synthesize_speech(
                                 result.assistant_message
                             ):
-                                enc = base64.b64encode(pcm_chunk).decode("ascii")
-                                await websocket.send_json({"type": "audio_chunk", "data": enc})
+                                await send_audio(pcm_chunk)
                         except Exception as tts_err:
                             logger.exception("Text-turn TTS failed: %s", tts_err)
                         finally:
-                            await websocket.send_json({"type": "audio_end"})
+                            await websocket.send_text(_AUDIO_END_FRAME)
                     except Exception as e:
                         logger.exception("Voice text turn failed: %s", e)
-                        await websocket.send_json(
+                        await send_json(
                             {"type": "error", "data": f"Processing error: {e}"}
                         )
                     continue
 
                 if not combined_audio:
-                    await websocket.send_json(
+                    await send_json(
                         {"type": "error", "data": "No audio data received"}
                     )
                     continue
 
                 if not voice_service:
-                    await websocket.send_json(
+                    await send_json(
                         {"type": "error", "data": "Voice service not initialized"}
                     )
                     continue
 
                 try:
-                    audio_array = voice_service.audio_bytes_to_int16_24k(combined_audio)
+                    audio_array = await asyncio.to_thread(
+                        voice_service.audio_bytes_to_int16_24k, combined_audio
+                    )
                 except Exception as dec_err:
                     logger.warning("Audio decode failed: %s", dec_err)
-                    await websocket.send_json(
+                    await send_json(
                         {
                             "type": "error",
                             "data": f"Audio decode failed: {dec_err}",
@@ -418,7 +458,7 @@ async def public_voice_session(websocket: WebSocket, session_id: str):
                         "Audio too quiet or too short (rms=%.1f, dur=%.2fs) — skipping STT",
                         rms, duration_s,
                     )
-                    await websocket.send_json(
+                    await send_json(
                         {
                             "type": "assistant_message",
                             "data": "I didn't quite catch that. Could you please speak a bit louder?",
@@ -426,7 +466,7 @@ async def public_voice_session(websocket: WebSocket, session_id: str):
                             "accepted": True,
                         }
                     )
-                    await websocket.send_json({"type": "audio_end"})
+                    await websocket.send_text(_AUDIO_END_FRAME)
                     continue
 
                 from agents.voice import AudioInput
@@ -442,10 +482,10 @@ async def public_voice_session(websocket: WebSocket, session_id: str):
                     vp_result = await pipeline.run(AudioInput(buffer=audio_array))
                 except Exception as pipe_err:
                     logger.exception("VoicePipeline failed: %s", pipe_err)
-                    await websocket.send_json(
+                    await send_json(
                         {"type": "error", "data": f"Voice processing failed: {pipe_err}"}
                     )
-                    await websocket.send_json(
+                    await send_json(
                         {
                             "type": "assistant_message",
                             "data": "",
@@ -453,7 +493,7 @@ async def public_voice_session(websocket: WebSocket, session_id: str):
                             "accepted": False,
                         }
                     )
-                    await websocket.send_json({"type": "audio_end"})
+                    await websocket.send_text(_AUDIO_END_FRAME)
                     continue
 
                 audio_parts: list[bytes] = []
@@ -488,19 +528,18 @@ async def public_voice_session(websocket: WebSocket, session_id: str):
                 finally:
                     pcm_out = b"".join(audio_parts) if audio_parts else None
                     if pcm_out:
-                        chunk_size = 4096
-                        for i in range(0, len(pcm_out), chunk_size):
-                            enc = base64.b64encode(pcm_out[i : i + chunk_size]).decode("ascii")
-                            await websocket.send_json({"type": "audio_chunk", "data": enc})
+                        pcm_view = memoryview(pcm_out)
+                        for i in range(0, len(pcm_view), VOICE_AUDIO_CHUNK_BYTES):
+                            await send_audio(pcm_view[i : i + VOICE_AUDIO_CHUNK_BYTES])
 
                     lr = workflow.last_result or {}
                     # SDK VoicePipeline does not emit STT as a stream event; use workflow result.
                     if lr.get("transcription"):
-                        await websocket.send_json(
+                        await send_json(
                             {"type": "transcription", "data": lr["transcription"]}
                         )
 
-                    await websocket.send_json(
+                    await send_json(
                         {
                             "type": "assistant_message",
                             "data": lr.get("response", ""),
@@ -509,16 +548,16 @@ async def public_voice_session(websocket: WebSocket, session_id: str):
                         }
                     )
                     if stream_exc is not None:
-                        await websocket.send_json(
+                        await send_json(
                             {
                                 "type": "error",
                                 "data": f"Voice stream interrupted: {stream_exc}",
                             }
                         )
-                    await websocket.send_json({"type": "audio_end"})
+                    await websocket.send_text(_AUDIO_END_FRAME)
                 continue
 
-            await websocket.send_json({"type": "error", "data": f"Unknown message type: {msg_type}"})
+            await send_json({"type": "error", "data": f"Unknown message type: {msg_type}"})
 
     except WebSocketDisconnect:
         pass
@@ -363,14 +363,15 @@ def _load_collected_answers(db: Session, session_id: str) -> dict[str, str]:
 
 
 def _load_history(db: Session, session_id: str, max_messages: int = 10) -> list[dict[str, Any]]:
-    messages = (
-        db.execute(select(Message).where(Message.session_id == session_id).order_by(Message.created_at.asc()))
-        .scalars().all()
-    )
-    items = [{"role": m.role, "content": m.content} for m in messages if m.role in ("user", "assistant")]
-    if len(items) > max_messages:
-        items = items[-max_messages:]
-    return items
+    # Only the newest max_messages turns are used, so let the DB apply the window
+    # instead of hydrating the whole transcript and slicing it in Python.
+    rows = db.execute(
+        select(Message.role, Message.content)
+        .where(Message.session_id == session_id, Message.role.in_(("user", "assistant")))
+        .order_by(Message.created_at.desc())
+        .limit(max_messages)
+    ).all()
+    return [{"role": role, "content": content} for role, content in reversed(rows)]
 
 
 # ---------------------------------------------------------------------------
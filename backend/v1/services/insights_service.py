@@ -49,6 +49,15 @@ def compute_field_distributions(db: Session, form: Form) -> FormFieldDistributio
     fields_schema: list[dict[str, Any]] = form.fields_schema or []
     result_fields: list[FieldDistribution] = []
 
+    # Fetch value counts for every field in one grouped query, then partition by field.
+    rows_by_field: dict[str, list] = {}
+    for row in db.execute(
+        select(Answer.field_key, Answer.value_text, func.count().label("cnt"))
+        .where(Answer.form_id == form.id)
+        .group_by(Answer.field_key, Answer.value_text)
+    ).all():
+        rows_by_field.setdefault(row.field_key, []).append(row)
+
     for f_def in fields_schema:
         field_key: str = f_def.get("name", "")
         field_name: str = f_def.get("description") or field_key
@@ -57,13 +66,7 @@ def compute_field_distributions(db: Session, form: Form) -> FormFieldDistributio
         if not field_key:
             continue
 
-        # Fetch value counts from DB
-        rows = db.execute(
-            select(Answer.value_text, func.count().label("cnt"))
-            .where(Answer.form_id == form.id, Answer.field_key == field_key)
-            .group_by(Answer.value_text)
-        ).all()
-
+        rows = rows_by_field.get(field_key, [])
         total_responses = sum(r.cnt for r in rows)
 
         if field_type in _NUMERIC_TYPES:
@@ -33,6 +33,11 @@ PROMPT_BLEED_PHRASES = frozenset({
     "return an empty string",
     "answering form questions",
 })
+# One scan instead of a substring test per phrase.
+_PROMPT_BLEED_RE = re.compile(
+    "|".join(re.escape(p) for p in sorted(PROMPT_BLEED_PHRASES, key=len, reverse=True)),
+    re.IGNORECASE,
+)
 
 
 def _is_only_filler(text: str) -> bool:
@@ -50,10 +55,8 @@ def _sanitise_transcription(text: str) -> str | None:
         return None
     if _is_only_filler(t):
         return None
-    lower = t.lower()
-    for phrase in PROMPT_BLEED_PHRASES:
-        if phrase in lower:
-            return None
+    if _PROMPT_BLEED_RE.search(t):
+        return None
     return t
 
 
@@ -147,8 +147,8 @@ class SessionStore:
             _, _, count, _ = pipe.execute()
             return count <= max_requests
         else:
-            entries = self.get(rate_key) or []
-            entries = [t for t in entries if t > now - window_seconds]
+            window_start = now - window_seconds
+            entries = [t for t in self.get(rate_key) or () if t > window_start]
             entries.append(now)
             self.set(rate_key, entries, ttl=window_seconds)
             return len(entries) <= max_requests
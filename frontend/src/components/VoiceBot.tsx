@@ -56,7 +56,7 @@ export default function VoiceBot() {
 					<div className="mt-3 flex items-center gap-2 px-4 py-2 bg-stone-50 rounded-full">
 						<div className="w-1.5 h-1.5 rounded-full bg-forest-500 animate-pulse"></div>
 						<p className="text-forest-600 text-sm font-medium">
-							Processing: {processingTime}s
+							Processing: {processingTime.toFixed(3)}s
 						</p>
 					</div>
 				)}
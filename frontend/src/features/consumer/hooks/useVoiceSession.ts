@@ -82,7 +82,6 @@ export function useVoiceSession({
 	const pendingAudioEndRef = useRef(false);
 	const onPlaybackDoneRef = useRef<(() => void) | null>(null);
 	const firstServerAudioTurnDoneRef = useRef(false);
-	const pendingFileReadsRef = useRef(0);
 	/** Set synchronously when form completes so audio_end cannot auto-start before stateRef updates. */
 	const sessionCompletedRef = useRef(false);
 
@@ -222,13 +221,22 @@ export function useVoiceSession({
 		const wsUrl = `${protocol}//${window.location.host}/v1/public/sessions/${sessionId}/voice`;
 
 		const ws = new WebSocket(wsUrl);
+		// Audio travels as raw binary frames (negotiated with `binary: true` on auth)
+		ws.binaryType = "arraybuffer";
 		wsRef.current = ws;
 
 		ws.onopen = () => {
-			ws.send(JSON.stringify({ type: "auth", token: sessionToken }));
+			ws.send(JSON.stringify({ type: "auth", token: sessionToken, binary: true }));
 		};
 
 		ws.onmessage = (event) => {
+			if (event.data instanceof ArrayBuffer) {
+				audioQueueRef.current.push(event.data);
+				if (!isPlayingRef.current) {
+					playAudioQueue();
+				}
+				return;
+			}
 			try {
 				const data = JSON.parse(event.data);
 
@@ -346,23 +354,13 @@ export function useVoiceSession({
 			setVoiceState("processing");
 		}
 
-		const sendStopWhenReady = () => {
-			const deadline = Date.now() + 3000;
-			const tick = () => {
-				if (pendingFileReadsRef.current <= 0 || Date.now() > deadline) {
-					wsRef.current?.send(JSON.stringify({ type: "stop" }));
-					mediaRecorderRef.current = null;
-					vadStoppingRef.current = false;
-					return;
-				}
-				setTimeout(tick, 15);
-			};
-			setTimeout(tick, 0);
-		};
-
 		recorder.onstop = () => {
-			// Do NOT stop mic tracks — stream is persistent for hands-free turns
-			sendStopWhenReady();
+			// Do NOT stop mic tracks — stream is persistent for hands-free turns.
+			// The final dataavailable has already queued its binary frame, so
+			// "stop" arrives after all audio.
+			wsRef.current?.send(JSON.stringify({ type: "stop" }));
+			mediaRecorderRef.current = null;
+			vadStoppingRef.current = false;
 		};
 		recorder.stop();
 	}, [setVoiceState]);
@@ -399,7 +397,6 @@ export function useVoiceSession({
 
 		mediaRecorderRef.current = mediaRecorder;
 		audioChunksRef.current = [];
-		pendingFileReadsRef.current = 0;
 		speechDetectedRef.current = false;
 		silenceStartRef.current = null;
 		setVadUserHasSpoken(false);
@@ -436,24 +433,8 @@ export function useVoiceSession({
 		mediaRecorder.ondataavailable = (e) => {
 			if (e.data.size > 0) {
 				audioChunksRef.current.push(e.data);
-
-				pendingFileReadsRef.current += 1;
-				const reader = new FileReader();
-				reader.onloadend = () => {
-					pendingFileReadsRef.current -= 1;
-					try {
-						const base64 = (reader.result as string).split(",")[1];
-						if (base64) {
-							wsRef.current?.send(JSON.stringify({ type: "audio_chunk", data: base64 }));
-						}
-					} catch {
-						// ignore
-					}
-				};
-				reader.onerror = () => {
-					pendingFileReadsRef.current -= 1;
-				};
-				reader.readAsDataURL(e.data);
+				// Send the recorded Blob as a binary frame (no base64 round-trip)
+				wsRef.current?.send(e.data);
 			}
 		};
 
@@ -30,7 +30,7 @@ export function useAudio() {
 	}, []);
 
 	const startRecording = useCallback(
-		async (onChunk?: (base64: string) => void) => {
+		async (onChunk?: (chunk: Blob) => void) => {
 			if (!serviceRef.current || !isInitialized) {
 				throw new Error("Audio not initialized");
 			}
@@ -41,7 +41,7 @@ export function useAudio() {
 		[isInitialized]
 	);
 
-	const stopRecording = useCallback(async (): Promise<string> => {
+	const stopRecording = useCallback(async (): Promise<Blob> => {
 		if (!serviceRef.current) {
 			throw new Error("Recorder not initialized");
 		}
@@ -83,14 +83,14 @@ export function useAudio() {
 		}
 	}, []);
 
-	const playPCMChunks = useCallback(async (base64Chunks: string[]) => {
+	const playPCMChunks = useCallback(async (chunks: ArrayBuffer[]) => {
 		if (!serviceRef.current) {
 			throw new Error("Audio service not initialized");
 		}
 
 		setIsPlaying(true);
 		try {
-			await serviceRef.current.playPCMChunks(base64Chunks);
+			await serviceRef.current.playPCMChunks(chunks);
 		} catch (error) {
 			console.error("Error in playPCMChunks:", error);
 			throw error;
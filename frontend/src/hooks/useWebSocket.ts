@@ -24,7 +24,7 @@ interface UseWebSocketReturn {
 }
 
 export function useWebSocket(
-	onAudioChunk?: (base64Audio: string) => void,
+	onAudioChunk?: (audio: ArrayBuffer) => void,
 	onTranscription?: (text: string) => void
 ): UseWebSocketReturn {
 	const [state, setState] = useState<AgentState>("disconnected");
@@ -47,8 +47,8 @@ export function useWebSocket(
 				setTranscription(text);
 				onTranscription?.(text);
 			},
-			onAudioChunk: (base64Audio) => {
-				onAudioChunk?.(base64Audio);
+			onAudioChunk: (audio) => {
+				onAudioChunk?.(audio);
 			},
 			onError: (errorMsg) => {
 				setError(errorMsg);
@@ -76,17 +76,10 @@ export class AudioServiceManager {
 		return this.isInitialized;
 	}
 
-	async startRecording(onChunk?: (base64: string) => void): Promise<void> {
+	async startRecording(onChunk?: (chunk: Blob) => void): Promise<void> {
 		const recorder = this.getRecorder();
 
-		const onChunkWrapper = async (blob: Blob) => {
-			if (onChunk) {
-				const base64 = await recorder.blobToBase64(blob);
-				onChunk(base64);
-			}
-		};
-
-		recorder.startRecording(onChunkWrapper);
+		recorder.startRecording(onChunk);
 
 		// Start silence detection monitoring
 		if (this.silenceDetection) {
@@ -94,7 +87,7 @@ export class AudioServiceManager {
 		}
 	}
 
-	async stopRecording(): Promise<string> {
+	async stopRecording(): Promise<Blob> {
 		const recorder = this.getRecorder();
 
 		// Stop silence detection monitoring
@@ -102,8 +95,7 @@ export class AudioServiceManager {
 			this.silenceDetection.stopMonitoring();
 		}
 
-		const blob = await recorder.stopRecording();
-		return await recorder.blobToBase64(blob);
+		return await recorder.stopRecording();
 	}
 
 	async playAudio(base64Audio: string): Promise<void> {
@@ -124,7 +116,7 @@ export class AudioServiceManager {
 		await this.player.playPCMChunk(base64PCM);
 	}
 
-	async playPCMChunks(base64Chunks: string[]): Promise<void> {
+	async playPCMChunks(chunks: ArrayBuffer[]): Promise<void> {
 		// Ensure player instance exists
 		if (!this.player) {
 			console.log(
@@ -133,7 +125,7 @@ export class AudioServiceManager {
 			this.player = new AudioPlayer();
 		}
 
-		await this.player.playPCMChunks(base64Chunks);
+		await this.player.playPCMChunks(chunks);
 	}
 
 	isRecording(): boolean {
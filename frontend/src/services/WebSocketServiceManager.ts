@@ -1,7 +1,7 @@
 import { AgentState } from "../hooks/useWebSocket";
 
 export interface WebSocketMessage {
-	type: "state" | "transcription" | "audio_chunk" | "error";
+	type: "state" | "transcription" | "audio_stream_begin" | "error";
 	data: string;
 	processing_time?: number;
 }
@@ -9,7 +9,7 @@ export interface WebSocketMessage {
 export interface WebSocketServiceCallbacks {
 	onStateChange?: (state: AgentState) => void;
 	onTranscription?: (text: string) => void;
-	onAudioChunk?: (base64Audio: string) => void;
+	onAudioChunk?: (audio: ArrayBuffer) => void;
 	onError?: (error: string) => void;
 	onProcessingTime?: (time: number | null) => void;
 }
@@ -42,6 +42,8 @@ export class WebSocketServiceManager {
 				import.meta.env.VITE_WS_URL ||
 				"ws://localhost:8000/ws";
 			const ws = new WebSocket(url);
+			// TTS audio arrives as raw PCM binary frames
+			ws.binaryType = "arraybuffer";
 
 			ws.onopen = () => {
 				console.log("WebSocket connected");
@@ -64,6 +66,10 @@ export class WebSocketServiceManager {
 			};
 
 			ws.onmessage = (event) => {
+				if (event.data instanceof ArrayBuffer) {
+					this.callbacks.onAudioChunk?.(event.data);
+					return;
+				}
 				try {
 					const message: WebSocketMessage = JSON.parse(event.data);
 					console.log("📨 WebSocket message received:", {
@@ -97,12 +103,8 @@ export class WebSocketServiceManager {
 							this.transcription = message.data;
 							this.callbacks.onTranscription?.(message.data);
 							break;
-						case "audio_chunk":
-							console.log(
-								"🎵 Audio chunk received, length:",
-								message.data?.length
-							);
-							this.callbacks.onAudioChunk?.(message.data);
+						case "audio_stream_begin":
+							console.log("🎵 Audio stream starting");
 							break;
 						case "error":
 							this.error = message.data;
@@ -164,6 +166,14 @@ export class WebSocketServiceManager {
 		}
 	}
 
+	sendAudio(audio: Blob | ArrayBuffer): void {
+		if (this.ws?.readyState === WebSocket.OPEN) {
+			this.ws.send(audio);
+		} else {
+			console.warn("WebSocket is not connected");
+		}
+	}
+
 	private setState(newState: AgentState): void {
 		this.state = newState;
 		this.callbacks.onStateChange?.(newState);
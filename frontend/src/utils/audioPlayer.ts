@@ -123,41 +123,31 @@ export class AudioPlayer {
 
 	/**
 	 * Play multiple PCM chunks that were collected as a complete audio
-	 * Decodes each base64 chunk individually and concatenates the binary data
+	 * Concatenates the raw PCM chunks received as binary WebSocket frames
 	 */
-	async playPCMChunks(base64Chunks: string[]): Promise<void> {
+	async playPCMChunks(chunks: ArrayBuffer[]): Promise<void> {
 		if (!this.audioContext) {
 			await this.initialize();
 		}
 
-		if (base64Chunks.length === 0) {
+		if (chunks.length === 0) {
 			console.warn("No PCM chunks to play");
 			return;
 		}
 
 		try {
-			// Decode each base64 chunk to bytes and collect all bytes
+			// View each binary chunk as bytes and collect all bytes
 			const allBytes: Uint8Array[] = [];
 			let totalLength = 0;
 
-			for (const base64Chunk of base64Chunks) {
-				try {
-					const binaryString = atob(base64Chunk);
-					const bytes = new Uint8Array(binaryString.length);
-					for (let i = 0; i < binaryString.length; i++) {
-						bytes[i] = binaryString.charCodeAt(i);
-					}
-					allBytes.push(bytes);
-					totalLength += bytes.length;
-				} catch (error) {
-					console.error("Error decoding chunk:", error);
-					// Skip invalid chunks
-					continue;
-				}
+			for (const chunk of chunks) {
+				const bytes = new Uint8Array(chunk);
+				allBytes.push(bytes);
+				totalLength += bytes.length;
 			}
 
 			if (totalLength === 0) {
-				console.warn("No valid audio data after decoding chunks");
+				console.warn("No audio data in received chunks");
 				return;
 			}
 
@@ -170,7 +160,7 @@ export class AudioPlayer {
 			}
 
 			console.log(
-				`Combined ${base64Chunks.length} chunks into ${combinedBytes.length} bytes`
+				`Combined ${chunks.length} chunks into ${combinedBytes.length} bytes`
 			);
 
 			// Ensure we have an even number of bytes (Int16 = 2 bytes per sample)
@@ -27,8 +27,8 @@ export interface VoiceBotViewModelCallbacks {
 export class VoiceBotViewModel {
 	private conversationHistory: ConversationMessage[] = [];
 	private effectiveState: AgentState = "disconnected";
-	private audioChunksBuffer: string[] = [];
-	private pcmChunksBuffer: string[] = [];
+	private audioChunksBuffer: Blob[] = [];
+	private pcmChunksBuffer: ArrayBuffer[] = [];
 	private isCollecting = false;
 	private isPlayingRef = false;
 	private turnCount = 0;
@@ -97,11 +97,10 @@ export class VoiceBotViewModel {
 	}
 
 	// Handle audio chunk from backend
-	handleAudioChunk(base64Audio: string) {
+	handleAudioChunk(audio: ArrayBuffer) {
 		console.log("📥 PCM Audio chunk received:", {
-			chunkSize: base64Audio.length,
+			chunkSize: audio.byteLength,
 			totalChunks: this.pcmChunksBuffer.length + 1,
-			preview: base64Audio.substring(0, 50),
 		});
 
 		// Start collecting chunks
@@ -121,7 +120,7 @@ export class VoiceBotViewModel {
 		}
 
 		// Add chunk to buffer
-		this.pcmChunksBuffer.push(base64Audio);
+		this.pcmChunksBuffer.push(audio);
 		console.log(`📦 Buffered chunk ${this.pcmChunksBuffer.length}`);
 	}
 
@@ -261,9 +260,9 @@ export class VoiceBotViewModel {
 			});
 
 			// Start recording with chunk callback
-			await this.audioService.startRecording(async (base64Chunk) => {
+			await this.audioService.startRecording(async (chunk) => {
 				// Buffer chunks locally instead of streaming
-				this.audioChunksBuffer.push(base64Chunk);
+				this.audioChunksBuffer.push(chunk);
 				console.log(
 					`📦 Buffered audio chunk ${this.audioChunksBuffer.length}`
 				);
@@ -294,16 +293,14 @@ export class VoiceBotViewModel {
 				`📤 Sending ${this.audioChunksBuffer.length} buffered chunks to backend`
 			);
 
-			// Send all buffered chunks to backend
+			// Send all buffered chunks to backend as binary frames
 			for (let i = 0; i < this.audioChunksBuffer.length; i++) {
-				this.wsService.sendMessage(
-					"audio_chunk",
-					this.audioChunksBuffer[i]
-				);
+				this.wsService.sendAudio(this.audioChunksBuffer[i]);
 			}
 
 			// Send final audio blob and stop signal
-			this.wsService.sendMessage("stop_recording", finalAudio);
+			this.wsService.sendAudio(finalAudio);
+			this.wsService.sendMessage("stop_recording", "");
 
 			// Clear buffer
 			this.audioChunksBuffer = [];
@@ -95,9 +95,9 @@ export function useVoiceBotViewModel() {
 
 		// Set up WebSocket callbacks
 		wsServiceRef.current.updateCallbacks({
-			onAudioChunk: (base64Audio: string) => {
+			onAudioChunk: (audio: ArrayBuffer) => {
 				if (viewModelRef.current) {
-					viewModelRef.current.handleAudioChunk(base64Audio);
+					viewModelRef.current.handleAudioChunk(audio);
 				}
 			},
 			onTranscription: (text: string) => {